@@ -14,15 +14,16 @@ import argparse
 import json
 import logging
 import os
+import signal
 import sys
-import subprocess
 import _thread
+import threading
 import time
-import multiprocessing
 import trace
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+import io
 from io import StringIO
-from time import ctime
-from subprocess import check_output
 from rsmiBindings import *
 
 # rocmSmiLib_cli version. Increment this as needed.
@@ -67,17 +68,22 @@ validClockNames = clk_type_names[1:-2]
 validClockNames.append('pcie')
 validClockNames.sort()
 
+# O(1) lookups for the list-position enums defined in rsmiBindings
+MEMORY_TYPE_IDX = {name: idx for idx, name in enumerate(memory_type_l)}
+TEMP_TYPE_IDX = {name: idx for idx, name in enumerate(temp_type_lst)}
+EVENT_TYPE_IDX = {name: idx for idx, name in enumerate(notification_type_names)}
+FW_BLOCK_IDX = {name: idx for idx, name in enumerate(fw_block_names_l)}
+VALID_CLOCK_SET = frozenset(validClockNames)
+SORTED_CLK_NAMES = tuple(sorted(rsmi_clk_names_dict))
+
 def driverInitialized():
     """ Returns true if amdgpu is found in the list of initialized modules
     """
-    driverInitialized = ''
     try:
-        driverInitialized = str(subprocess.check_output("cat /sys/module/amdgpu/initstate |grep live", shell=True))
-    except subprocess.CalledProcessError:
-        pass
-    if len(driverInitialized) > 0:
-        return True
-    return False
+        with open('/sys/module/amdgpu/initstate') as initstate:
+            return 'live' in initstate.read()
+    except OSError:
+        return False
 
 
 def formatJson(device, log):
@@ -87,68 +93,45 @@ def formatJson(device, log):
     :param log: String to parse and output into JSON format
     """
     global JSON_DATA
+    bucket = JSON_DATA['system' if device == 'system' else 'card%d' % device]
     for line in log.splitlines():
         # Drop any invalid or improperly-formatted data
-        if ':' not in line:
+        key, sep, value = line.partition(': ')
+        if not sep:
             continue
-        logTuple = line.split(': ')
-        if str(device) != 'system':
-            JSON_DATA['card' + str(device)][logTuple[0]] = logTuple[1].strip()
-        else:
-            JSON_DATA['system'][logTuple[0]] = logTuple[1].strip()
+        bucket[key] = value.strip()
 
 
 def formatCsv(deviceList):
     """ Print out the JSON_DATA in CSV format """
     global JSON_DATA
-    jsondata = json.dumps(JSON_DATA)
-    outstr = jsondata
     # Check if the first json data element is 'system' or 'device'
-    outputType = outstr[outstr.find('\"')+1:]
-    outputType = outputType[:outputType.find('\"')]
-    header = []
-    my_string = ''
-    if outputType != 'system':
-        header.append('device')
-    else:
-        header.append('system')
+    outputType = next(iter(JSON_DATA), None)
     if outputType == 'system':
-        jsonobj = json.loads(jsondata)
-        keylist = header
-        for record in jsonobj['system']:
-            my_string += "\"%s\", \"%s\"\n" % (record, jsonobj['system'][record])
-        # add header
-        my_string = "name, value\n" + my_string
-        return my_string
-    headerkeys = []
-    # Separate device-specific information from system-level information
-    for dev in deviceList:
-        if str(dev) != 'system':
-            headerkeys.extend(l for l in JSON_DATA['card' + str(dev)].keys() if l not in headerkeys)
-        else:
-            headerkeys.extend(l for l in JSON_DATA['system'].keys() if l not in headerkeys)
-    header.extend(headerkeys)
-    outStr = '%s\n' % ','.join(header)
-    if len(header) <= 1:
+        lines = ['name, value']
+        for record, value in JSON_DATA['system'].items():
+            lines.append('"%s", "%s"' % (record, value))
+        return '\n'.join(lines) + '\n'
+    # Separate device-specific information from system-level information;
+    # dict.fromkeys dedupes the keys while preserving their order
+    headerkeys = list(dict.fromkeys(
+        key for dev in deviceList
+        for key in JSON_DATA['system' if dev == 'system' else 'card%d' % dev]))
+    if not headerkeys:
         return ''
+    lines = ['%s' % ','.join(['device'] + headerkeys)]
     for dev in deviceList:
-        if str(dev) != 'system':
-            outStr += 'card%s,' % dev
+        if dev != 'system':
+            bucket = JSON_DATA['card%d' % dev]
+            row = ['card%d' % dev]
         else:
-            outStr += 'system,'
-        for val in headerkeys:
-            try:
-                if str(dev) != 'system':
-                    # Remove commas like the ones in PCIe speed
-                    outStr += '%s,' % JSON_DATA['card' + str(dev)][val].replace(',', '')
-                else:
-                    outStr += '%s,' % JSON_DATA['system'][val].replace(',', '')
-            except KeyError as e:
-                # If the key doesn't exist (like dcefclock on Fiji, or unsupported functionality)
-                outStr += 'N/A,'
-        # Drop the trailing ',' and replace it with a \n
-        outStr = '%s\n' % outStr[0:-1]
-    return outStr
+            bucket = JSON_DATA['system']
+            row = ['system']
+        # Remove commas like the ones in PCIe speed; keys that don't exist
+        # (like dcefclock on Fiji, or unsupported functionality) print N/A
+        row.extend(bucket.get(key, 'N/A').replace(',', '') for key in headerkeys)
+        lines.append(','.join(row))
+    return '\n'.join(lines) + '\n'
 
 
 def formatMatrixToJSON(deviceList, matrix, metricName):
@@ -170,18 +153,131 @@ def formatMatrixToJSON(deviceList, matrix, metricName):
 
     Where matrix content is: [[0, 40], [40, 0]]
     """
-    devices_ind = range(len(deviceList))
-    for row_indx in devices_ind:
-        # Start at row_indx +1 to avoid printing repeated values ( GPU1 x GPU2 is the same as GPU2 x GPU1 )
-        for col_ind in range(row_indx + 1, len(deviceList)):
-            try:
-                valueStr = matrix[deviceList[row_indx]][deviceList[col_ind]].value
-            except AttributeError:
-                valueStr = matrix[deviceList[row_indx]][deviceList[col_ind]]
+    # Only walk the upper triangle; GPU1 x GPU2 is the same as GPU2 x GPU1
+    for row_indx, col_ind in combinations(range(len(deviceList)), 2):
+        valueStr = matrix[deviceList[row_indx]][deviceList[col_ind]]
+        if hasattr(valueStr, 'value'):
+            valueStr = valueStr.value
+        printSysLog(metricName.format(deviceList[row_indx], deviceList[col_ind]), valueStr)
+
+
+# Thread pool shared by read-only per-device queries; created on first use
+_DEVICE_POOL = None
+
+def mapDevices(getter, deviceList):
+    """ Run a read-only per-device getter over a list of devices in parallel
+
+        ctypes releases the GIL while the library blocks on sysfs, so the
+        per-device calls overlap and a multi-GPU query no longer pays the
+        device count as a latency multiplier. Each worker must touch only
+        its own device; work that spans devices must stay serial.
+
+    :param getter: Callable taking a single device argument
+    :param deviceList: List of DRM devices (can be a single-item list)
+    """
+    global _DEVICE_POOL
+    if len(deviceList) < 2:
+        return {device: getter(device) for device in deviceList}
+    if _DEVICE_POOL is None:
+        _DEVICE_POOL = ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1))
+    return dict(zip(deviceList, _DEVICE_POOL.map(getter, deviceList)))
+
+
+# Bound once so getBus does not re-parse the format spec per device
+_bdf_format = '{:04X}:{:02X}:{:02X}.{:0X}'.format
+
+# Per-thread reusable buffer for the fixed-size string getters
+_TLS = threading.local()
+
+def stringBuffer(size=MAX_BUFF_SIZE):
+    """ Return a zeroed string buffer reused across calls on this thread
+
+        The string getters previously allocated a fresh ctypes buffer on
+        every call only to discard it after decoding. Each value is decoded
+        before the buffer is handed out again, so one buffer per thread is
+        safe even with mapDevices running getters concurrently.
+
+    :param size: Minimum buffer size in bytes
+    """
+    buf = getattr(_TLS, 'buf', None)
+    if buf is None or sizeof(buf) < size:
+        buf = create_string_buffer(size)
+        _TLS.buf = buf
+    else:
+        memset(buf, 0, size)
+    return buf
+
+
+# Cache for getters whose values do not change while the CLI is running
+_STATIC_GETTER_CACHE = {}
+
+def clockBuffers():
+    """ Return this thread's reusable frequency and bandwidth structures
+
+        The clock display paths only read these after a successful get, by
+        which point the library has overwritten every field it reports, so
+        one pair per thread is safe under mapDevices as well.
+    """
+    bufs = getattr(_TLS, 'clock_bufs', None)
+    if bufs is None:
+        bufs = _TLS.clock_bufs = (rsmi_frequencies_t(), rsmi_pcie_bandwidth_t())
+    return bufs
+
+
+def showPerDevice(collect, deviceList):
+    """ Run a per-device display section across the thread pool
+
+        Each worker's printLog output is buffered on its own thread and
+        replayed in deviceList order afterwards, so sections read the
+        driver concurrently but print exactly what the serial loop would.
+        JSON output already accumulates per device and needs no buffering.
 
-            printSysLog(metricName.format(deviceList[row_indx], deviceList[col_ind]), valueStr)
+    :param collect: Function taking a device and printing via printLog
+    :param deviceList: List of DRM devices (can be a single-item list)
+    """
+    def worker(device):
+        _TLS.print_buffer = []
+        try:
+            result = collect(device)
+            return ''.join(_TLS.print_buffer), result
+        finally:
+            _TLS.print_buffer = None
+    gathered = mapDevices(worker, deviceList)
+    for device in deviceList:
+        output = gathered[device][0]
+        if output:
+            with _PRINT_LOCK:
+                try:
+                    sys.stdout.write(output)
+                except(BrokenPipeError, IOError):
+                    sys.exit(1)
+    return {device: gathered[device][1] for device in deviceList}
 
 
+def memoizeStaticGetter(getter):
+    """ Cache a per-device getter whose value is fixed for the lifetime of
+    a single CLI invocation
+
+    Multi-section commands like --showallinfo request the same static
+    values (IDs, names, versions, partitions) several times; caching them
+    avoids repeated ctypes round-trips into the library.
+
+    :param getter: Getter taking (device, ...) whose result to cache
+    """
+    name = getter.__name__
+    def wrapper(device, *args, **kwargs):
+        key = (name, device)
+        if key not in _STATIC_GETTER_CACHE:
+            _STATIC_GETTER_CACHE[key] = getter(device, *args, **kwargs)
+        return _STATIC_GETTER_CACHE[key]
+    wrapper.__name__ = name
+    wrapper.__doc__ = getter.__doc__
+    # Setters that change a cached value (e.g. partitions) must call this
+    wrapper.invalidate = lambda device: _STATIC_GETTER_CACHE.pop((name, device), None)
+    return wrapper
+
+
+@memoizeStaticGetter
 def getBus(device, silent=False):
     """ Return the bus identifier of a given device
 
@@ -203,10 +299,11 @@ def getBus(device, silent=False):
     device = (bdfid.value >> 3) & 0x1f
     function = bdfid.value & 0x7
 
-    pic_id = '{:04X}:{:02X}:{:02X}.{:0X}'.format(domain, bus, device, function)
+    pic_id = _bdf_format(domain, bus, device, function)
     if rsmi_ret_ok(ret, device, 'get_pci_id', silent):
         return pic_id
 
+@memoizeStaticGetter
 def getPartitionId(device, silent=False):
     """ Return the partition identifier of a given device
 
@@ -225,7 +322,7 @@ def getPartitionId(device, silent=False):
     # bits [15: 0]  = pci bus/device/function
     partition_num = (bdfid.value >> 28) & 0xf
     pci_id = bdfid.value
-    partition_id = '{:d}'.format(partition_num)
+    partition_id = str(partition_num)
     if rsmi_ret_ok(ret, device, 'get_pci_id', silent):
         return partition_id
 
@@ -286,6 +383,7 @@ def getGpuUse(device, silent=False):
     return -1
 
 
+@memoizeStaticGetter
 def getDRMDeviceId(device, silent=False):
     """ Return the hexadecimal value of a device's ID
 
@@ -301,6 +399,7 @@ def getDRMDeviceId(device, silent=False):
     return device_id_ret
 
 
+@memoizeStaticGetter
 def getRev(device, silent=False):
     """ Return the hexadecimal value of a device's Revision
 
@@ -312,9 +411,12 @@ def getRev(device, silent=False):
     ret = rocmsmi.rsmi_dev_revision_get(device, byref(dv_rev))
     revision_ret = "N/A"
     if rsmi_ret_ok(ret, device, 'get_device_rev', silent=silent):
-        revision_ret =  padHexValue(hex(dv_rev.value), 2)
+        # Format the padded hex directly; hex() + padHexValue would build
+        # and re-parse an intermediate string
+        revision_ret = '0x%02x' % (dv_rev.value)
     return revision_ret
 
+@memoizeStaticGetter
 def getSubsystemId(device, silent=False):
     """ Return the a device's subsystem id
 
@@ -322,7 +424,7 @@ def getSubsystemId(device, silent=False):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is off.
     """
-    model = create_string_buffer(MAX_BUFF_SIZE)
+    model = stringBuffer()
     ret = rocmsmi.rsmi_dev_subsystem_name_get(device, model, MAX_BUFF_SIZE)
     device_model = "N/A"
     if rsmi_ret_ok(ret, device, 'get_subsystem_name', silent=silent):
@@ -331,6 +433,7 @@ def getSubsystemId(device, silent=False):
         device_model = padHexValue(device_model, 4)
     return device_model
 
+@memoizeStaticGetter
 def getVendor(device, silent=False):
     """ Return the a device's vendor id
 
@@ -338,7 +441,7 @@ def getVendor(device, silent=False):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is off.
     """
-    vendor = create_string_buffer(MAX_BUFF_SIZE)
+    vendor = stringBuffer()
     device_vendor = "N/A"
     # Retrieve card vendor
     ret = rocmsmi.rsmi_dev_vendor_name_get(device, vendor, MAX_BUFF_SIZE)
@@ -347,6 +450,7 @@ def getVendor(device, silent=False):
         device_vendor = vendor.value.decode()
     return device_vendor
 
+@memoizeStaticGetter
 def getGUID(device, silent=False):
     """ Return the uint64 value of device's GUID,
     also referred as GPU ID - reported by KFD.
@@ -362,6 +466,7 @@ def getGUID(device, silent=False):
         guid_ret = guid.value
     return guid_ret
 
+@memoizeStaticGetter
 def getTargetGfxVersion(device, silent=False):
     """ Return the uint64 value of device's target
     graphics version as reported by KFD
@@ -377,6 +482,7 @@ def getTargetGfxVersion(device, silent=False):
         gfx_ver_ret = "gfx" + str(gfx_version.value)
     return gfx_ver_ret
 
+@memoizeStaticGetter
 def getNodeId(device, silent=False):
     """ Return the uint32 value of device's node id
     reported by KFD.
@@ -392,6 +498,7 @@ def getNodeId(device, silent=False):
         node_id_ret = node_id.value
     return node_id_ret
 
+@memoizeStaticGetter
 def getDeviceName(device, silent=False):
     """ Return the uint64 value of device's target
         graphics version as reported by KFD
@@ -401,7 +508,7 @@ def getDeviceName(device, silent=False):
         (you plan to handle manually). Default is off.
     """
     # Retrieve the device series
-    series = create_string_buffer(MAX_BUFF_SIZE)
+    series = stringBuffer()
     device_name_ret = "N/A"
     ret = rocmsmi.rsmi_dev_name_get(device, series, MAX_BUFF_SIZE)
     if rsmi_ret_ok(ret, device, 'get_name', silent=silent):
@@ -434,7 +541,7 @@ def getMemInfo(device, memType, silent=False):
         memory types.
     """
     memType = memType.upper()
-    if memType not in memory_type_l:
+    if memType not in MEMORY_TYPE_IDX:
         printErrLog(device, 'Invalid memory type %s' % (memType))
         return (None, None)
 
@@ -443,12 +550,12 @@ def getMemInfo(device, memType, silent=False):
     memUsed = None
     memTotal = None
 
-    ret = rocmsmi.rsmi_dev_memory_usage_get(device, memory_type_l.index(memType), byref(memoryUse))
-    if rsmi_ret_ok(ret, device, 'get_memory_usage_' + str(memType), silent):
+    ret = rocmsmi.rsmi_dev_memory_usage_get(device, MEMORY_TYPE_IDX[memType], byref(memoryUse))
+    if rsmi_ret_ok(ret, device, ('get_memory_usage_', memType), silent):
         memUsed = memoryUse.value
 
-    ret = rocmsmi.rsmi_dev_memory_total_get(device, memory_type_l.index(memType), byref(memoryTot))
-    if rsmi_ret_ok(ret, device, 'get_memory_total_' + str(memType), silent):
+    ret = rocmsmi.rsmi_dev_memory_total_get(device, MEMORY_TYPE_IDX[memType], byref(memoryTot))
+    if rsmi_ret_ok(ret, device, ('get_memory_total_', memType), silent):
         memTotal = memoryTot.value
     return (memUsed, memTotal)
 
@@ -462,19 +569,14 @@ def getProcessName(pid):
         logging.debug('PID must be greater than 0')
         return 'UNKNOWN'
     try:
-        pName = str(subprocess.check_output("ps -p %d -o comm=" % (int(pid)), shell=True))
-    except subprocess.CalledProcessError as e:
+        with open('/proc/%d/comm' % (int(pid))) as comm:
+            pName = comm.read().strip()
+    except OSError:
         pName = 'UNKNOWN'
 
-    if pName == None:
+    if not pName:
         pName = 'UNKNOWN'
 
-    # Remove the substrings surrounding from process name (b' and \n')
-    if str(pName).startswith('b\''):
-        pName = pName[2:]
-    if str(pName).endswith('\\n\''):
-        pName = pName[:-3]
-
     return pName
 
 
@@ -495,9 +597,24 @@ def getPerfLevel(device, silent=False):
 def getPid(name):
     """ Get the process id of a specific application
 
+        Scans /proc directly instead of forking pidof; the output matches
+        pidof (space-separated pids as bytes, trailing newline).
+
     :param name: Process name of a program to be parsed
     """
-    return check_output(['pidof', name])
+    name = name.encode()
+    pids = []
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open('/proc/%s/comm' % (entry.name), 'rb') as comm:
+                if comm.read().rstrip() == name:
+                    pids.append(entry.name.encode())
+        # Processes can exit between the scan and the read
+        except OSError:
+            continue
+    return b' '.join(pids) + b'\n'
 
 
 def getPidList():
@@ -505,13 +622,12 @@ def getPidList():
     num_items = c_uint32()
     ret = rocmsmi.rsmi_compute_process_info_get(None, byref(num_items))
     if rsmi_ret_ok(ret, metric='get_compute_process_info'):
-        buff_sz = num_items.value + 10
+        buff_sz = num_items.value
         procs = (rsmi_process_info_t * buff_sz)()
-        procList = []
-        ret = rocmsmi.rsmi_compute_process_info_get(byref(procs), byref(num_items))
-        for i in range(num_items.value):
-            procList.append('%s' % (procs[i].process_id))
-        return procList
+        ret = rocmsmi.rsmi_compute_process_info_get(procs, byref(num_items))
+        # The library caps the fill at the buffer size; cap again in case
+        # processes started between the two calls
+        return [str(procs[i].process_id) for i in range(min(num_items.value, buff_sz))]
     return
 
 
@@ -552,6 +668,10 @@ def getPower(device):
     return power_ret_dict
 
 
+# RAS enablement is keyed (device, block), so it gets its own cache rather
+# than the per-device getter cache; setRas invalidates entries it changes
+_RAS_STATE_CACHE = {}
+
 def getRasEnablement(device, block, silent=True):
     """ Return RAS enablement state for a given device
 
@@ -560,11 +680,15 @@ def getRasEnablement(device, block, silent=True):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is on.
     """
+    key = (device, block)
+    if key in _RAS_STATE_CACHE:
+        return _RAS_STATE_CACHE[key]
     state = rsmi_ras_err_state_t()
     ret = rocmsmi.rsmi_dev_ecc_status_get(device, rsmi_gpu_block_d[block], byref(state))
 
-    if rsmi_ret_ok(ret, device, 'get_ecc_status_' + str(block), silent):
-        return rsmi_ras_err_stale_machine[state.value].upper()
+    if rsmi_ret_ok(ret, device, ('get_ecc_status_', block), silent):
+        _RAS_STATE_CACHE[key] = rsmi_ras_err_stale_machine[state.value].upper()
+        return _RAS_STATE_CACHE[key]
     return 'N/A'
 
 
@@ -578,15 +702,21 @@ def getTemp(device, sensor, silent=True):
     """
     temp = c_int64(0)
     metric = rsmi_temperature_metric_t.RSMI_TEMP_CURRENT
-    ret = rocmsmi.rsmi_dev_temp_metric_get(c_uint32(device), temp_type_lst.index(sensor), metric, byref(temp))
-    if rsmi_ret_ok(ret, device, 'get_temp_metric' + str(sensor), silent):
+    ret = rocmsmi.rsmi_dev_temp_metric_get(c_uint32(device), TEMP_TYPE_IDX[sensor], metric, byref(temp))
+    if rsmi_ret_ok(ret, device, ('get_temp_metric', sensor), silent):
         return temp.value / 1000
     return 'N/A'
 
+# Remembers which temperature sensor answered first for each device
+_FIRST_TEMP_CACHE = {}
+
 def findFirstAvailableTemp(device):
     """ Discovers the first available device temperature to display
 
-        Returns a tuple of (temp_type, temp_value) for the device specified
+        Returns a tuple of (temp_type, temp_value) for the device specified.
+        Sensor availability is fixed for the life of the process, so the
+        first sensor that answers is remembered per device and the failing
+        probes before it are not repeated on later calls.
 
     :param device: DRM device identifier
     """
@@ -594,14 +724,14 @@ def findFirstAvailableTemp(device):
     metric = rsmi_temperature_metric_t.RSMI_TEMP_CURRENT
     ret_temp = "N/A"
     ret_temp_type = temp_type_lst[0]
-    for i, templist_val in enumerate(temp_type_lst):
+    for i in range(_FIRST_TEMP_CACHE.get(device, 0), len(temp_type_lst)):
+        templist_val = temp_type_lst[i]
         ret = rocmsmi.rsmi_dev_temp_metric_get(c_uint32(device), i, metric, byref(temp))
-        if rsmi_ret_ok(ret, device, 'get_temp_metric_' + templist_val, silent=True):
+        if rsmi_ret_ok(ret, device, ('get_temp_metric_', templist_val), silent=True):
+            _FIRST_TEMP_CACHE[device] = i
             ret_temp = temp.value / 1000
             ret_temp_type = '(' + templist_val.capitalize() + ')'
             break
-        else:
-            continue
     return (ret_temp_type, ret_temp)
 
 def getTemperatureLabel(deviceList):
@@ -637,6 +767,7 @@ def getPowerLabel(deviceList):
         powerLabel = rsmi_power_label.CURRENT_SOCKET_POWER
     return powerLabel
 
+@memoizeStaticGetter
 def getVbiosVersion(device, silent=False):
     """ Returns the VBIOS version for a given device
 
@@ -644,7 +775,7 @@ def getVbiosVersion(device, silent=False):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is off.
     """
-    vbios = create_string_buffer(256)
+    vbios = stringBuffer()
     ret = rocmsmi.rsmi_dev_vbios_version_get(device, vbios, 256)
     vbios_ret = "N/A"
     if rsmi_ret_ok(ret, device, silent=silent):
@@ -662,13 +793,14 @@ def getVersion(deviceList, component, silent=False):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is off.
     """
-    ver_str = create_string_buffer(256)
+    ver_str = stringBuffer()
     ret = rocmsmi.rsmi_version_str_get(component, ver_str, 256)
-    if rsmi_ret_ok(ret, None, 'get_version_str_' + str(component), silent):
+    if rsmi_ret_ok(ret, None, ('get_version_str_', component), silent):
         return ver_str.value.decode()
     return None
 
 
+@memoizeStaticGetter
 def getComputePartition(device, silent=True):
     """ Return the current compute partition of a given device
 
@@ -676,13 +808,14 @@ def getComputePartition(device, silent=True):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is on.
     """
-    currentComputePartition = create_string_buffer(MAX_BUFF_SIZE)
+    currentComputePartition = stringBuffer()
     ret = rocmsmi.rsmi_dev_compute_partition_get(device, currentComputePartition, MAX_BUFF_SIZE)
     if rsmi_ret_ok(ret, device, 'get_compute_partition', silent) and currentComputePartition.value.decode():
         return str(currentComputePartition.value.decode())
     return "N/A"
 
 
+@memoizeStaticGetter
 def getMemoryPartition(device, silent=True):
     """ Return the current memory partition of a given device
 
@@ -690,30 +823,132 @@ def getMemoryPartition(device, silent=True):
     :param silent: Turn on to silence error output
         (you plan to handle manually). Default is on.
     """
-    currentMemoryPartition = create_string_buffer(MAX_BUFF_SIZE)
+    currentMemoryPartition = stringBuffer()
     ret = rocmsmi.rsmi_dev_memory_partition_get(device, currentMemoryPartition, MAX_BUFF_SIZE)
     if rsmi_ret_ok(ret, device, 'get_memory_partition', silent) and currentMemoryPartition.value.decode():
         return str(currentMemoryPartition.value.decode())
     return "N/A"
 
 
+def snapshotDevice(device):
+    """ Return a dict of the scalar metrics for the device specified
+
+        Gathers the per-device scalars in one pass so scripted callers
+        (and multi-section output) make a single sweep over the library
+        instead of interleaving calls per section. The static values are
+        served from the per-device getter cache after the first sweep;
+        only the dynamic entries (power cap, busy percent, performance
+        level) are re-read on a later snapshot.
+
+    :param device: DRM device identifier
+    """
+    return {
+        'bus': getBus(device, silent=True),
+        'partition_id': getPartitionId(device, silent=True),
+        'device_id': getDRMDeviceId(device, silent=True),
+        'revision': getRev(device, silent=True),
+        'guid': getGUID(device, silent=True),
+        'node_id': getNodeId(device, silent=True),
+        'gfx_version': getTargetGfxVersion(device, silent=True),
+        'max_power': getMaxPower(device, silent=True),
+        'gpu_use': getGpuUse(device, silent=True),
+        'perf_level': getPerfLevel(device, silent=True),
+    }
+
+
+def runServer(socketPath, deviceList):
+    """ Serve snapshot queries from a resident process over a UNIX socket
+
+        Wrappers that poll rocm-smi in a loop pay interpreter startup and
+        library load on every sample. A resident server initializes the
+        library once and answers each query from the warm process instead.
+        Requests are one JSON object per line, e.g.
+        {"op": "snapshot", "devices": [0, 1]}; the reply is one JSON line.
+
+    :param socketPath: Filesystem path to bind the UNIX socket to
+    :param deviceList: List of DRM devices (can be a single-item list)
+    """
+    import socketserver
+
+    class SnapshotHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self.wfile.write(b'{"error": "invalid request"}\n')
+                return
+            if request.get('op') != 'snapshot':
+                self.wfile.write(b'{"error": "unsupported op"}\n')
+                return
+            devices = request.get('devices')
+            if not devices:
+                devices = deviceList
+            reply = {'card%d' % (device): snapshotDevice(device)
+                     for device in devices if device in deviceList}
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+    # A stale socket from an earlier server blocks the bind
+    if os.path.exists(socketPath):
+        os.unlink(socketPath)
+    server = socketserver.ThreadingUnixStreamServer(socketPath, SnapshotHandler)
+    printLog(None, 'Serving snapshot queries on %s (ctrl-c to stop)' % (socketPath), None)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(socketPath)
+        except OSError:
+            pass
+
+
+def queryServer(socketPath, devices):
+    """ Print a snapshot fetched from a resident server started with --serve
+
+        Skips library initialization entirely; the round trip through the
+        socket replaces the cold start of a fresh invocation.
+
+    :param socketPath: Filesystem path of the server's UNIX socket
+    :param devices: List of DRM devices to query, or None for all
+    """
+    import socket
+    request = {'op': 'snapshot'}
+    if devices:
+        request['devices'] = devices
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socketPath)
+            sock.sendall(json.dumps(request).encode() + b'\n')
+            reply = b''
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                reply += chunk
+    except OSError as e:
+        logging.error('Unable to query server on %s: %s', socketPath, e)
+        return 1
+    print(reply.decode().rstrip())
+    return 0
+
+
 def print2DArray(dataArray):
     """ Print 2D Array with uniform spacing """
     global PRINT_JSON
-    dataArrayLength = []
     isPid = False
     if str(dataArray[0][0]) == 'PID':
         isPid = True
-    for position in range(len(dataArray[0])):
-        dataArrayLength.append(len(dataArray[0][position]))
-    for position in range(len(dataArray)):
-        for cell in range(len(dataArray[0])):
-            if len(dataArray[position][cell]) > dataArrayLength[cell]:
-                dataArrayLength[cell] = len(dataArray[position][cell])
+    # zip(*...) transposes to columns so the width scan runs in C via map
+    dataArrayLength = [max(map(len, column)) for column in zip(*dataArray)]
+    # Build the row format once; str.format left-pads every cell C-side
+    rowFormat = ''.join('{:<%d}\t' % (width) for width in dataArrayLength)
     for position in range(len(dataArray)):
-        printString = ''
-        for cell in range(len(dataArray[0])):
-            printString += str(dataArray[position][cell]).ljust(dataArrayLength[cell], ' ') + '\t'
+        printString = rowFormat.format(*dataArray[position])
         if PRINT_JSON:
             printString = ' '.join(printString.split()).lower()
             firstElement = printString.split(' ', 1)[0]
@@ -743,12 +978,13 @@ def printErrLog(device, err):
     """
     global PRINT_JSON
     devName = device
+    # Positional args keep the interpolation inside logging, which skips
+    # it entirely when the level is filtered out
     for line in err.split('\n'):
-        errstr = 'GPU[%s]\t: %s' % (devName, line)
         if not PRINT_JSON:
-            logging.error(errstr)
+            logging.error('GPU[%s]\t: %s', devName, line)
         else:
-            logging.debug(errstr)
+            logging.debug('GPU[%s]\t: %s', devName, line)
 
 
 def printInfoLog(device, metricName, value):
@@ -761,6 +997,9 @@ def printInfoLog(device, metricName, value):
     global PRINT_JSON
 
     if not PRINT_JSON:
+        # Skip the string build altogether when INFO is filtered out
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         if value is not None:
             logstr = 'GPU[%s]\t: %s: %s' % (device, metricName, value)
         else:
@@ -771,6 +1010,57 @@ def printInfoLog(device, metricName, value):
         logging.info(logstr)
 
 
+def _printEmptyLineText():
+    print()
+
+
+def _printEmptyLineJson():
+    pass
+
+
+def _printErrLogText(device, err):
+    for line in err.split('\n'):
+        logging.error('GPU[%s]\t: %s', device, line)
+
+
+def _printErrLogJson(device, err):
+    # Errors stay out of the JSON document; route them to the debug log
+    for line in err.split('\n'):
+        logging.debug('GPU[%s]\t: %s', device, line)
+
+
+def _printInfoLogText(device, metricName, value):
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    if value is not None:
+        logstr = 'GPU[%s]\t: %s: %s' % (device, metricName, value)
+    else:
+        logstr = 'GPU[%s]\t: %s' % (device, metricName)
+    if device is None:
+        logstr = logstr[13:]
+
+    logging.info(logstr)
+
+
+def _printInfoLogJson(device, metricName, value):
+    pass
+
+
+def bindPrinters():
+    """ Rebind the simple printers to the variant matching PRINT_JSON
+
+        The flag is fixed once arguments are parsed, so the per-call flag
+        check and global read in printEmptyLine/printErrLog/printInfoLog
+        can be resolved a single time here. The flag-checking versions
+        above remain the defaults for library users that never parse args.
+    """
+    if PRINT_JSON:
+        variants = (_printEmptyLineJson, _printErrLogJson, _printInfoLogJson)
+    else:
+        variants = (_printEmptyLineText, _printErrLogText, _printInfoLogText)
+    globals()['printEmptyLine'], globals()['printErrLog'], globals()['printInfoLog'] = variants
+
+
 def printEventList(device, delay, eventList):
     """ Print out notification events for a specified device
 
@@ -784,7 +1074,7 @@ def printEventList(device, delay, eventList):
         printErrLog(device, 'Unable to initialize event notifications.')
         return
     for eventType in eventList:
-        mask |= 2 ** notification_type_names.index(eventType.upper())
+        mask |= 1 << EVENT_TYPE_IDX[eventType.upper()]
     ret = rocmsmi.rsmi_event_notification_mask_set(device, mask)
     if not rsmi_ret_ok(ret, device, 'set_event_notification_mask'):
         printErrLog(device, 'Unable to set event notification mask.')
@@ -794,8 +1084,13 @@ def printEventList(device, delay, eventList):
         data = rsmi_evt_notification_data_t(1)
         rocmsmi.rsmi_event_notification_get(delay, byref(num_elements), byref(data))
         if len(data.message) > 0:
-            print2DArray([['\rGPU[%d]:\t' % (data.dv_ind), ctime().split()[3], notification_type_names[data.event.value - 1],
+            print2DArray([['\rGPU[%d]:\t' % (data.dv_ind), time.strftime('%H:%M:%S'), notification_type_names[data.event.value - 1],
                            data.message.decode('utf8') + '\r']])
+            flushLog()
+
+# Single lock shared by every printLog call; constructing a fresh
+# multiprocessing.Lock per call cost a semaphore pair and excluded nothing
+_PRINT_LOCK = threading.Lock()
 
 def printLog(device, metricName, value=None, extraSpace=False, useItalics=False):
     """ Print out to the SMI log
@@ -824,27 +1119,35 @@ def printLog(device, metricName, value=None, extraSpace=False, useItalics=False)
         logstr = 'GPU[%s]\t\t: %s' % (device, metricName)
     if device is None:
         logstr = logstr.split(':', 1)[1][1:]
-    # Force thread safe printing
-    lock = multiprocessing.Lock()
-    lock.acquire()
     if useItalics:
         logstr = italics + logstr + end
+    if extraSpace:
+        logstr = '\n' + logstr
+    # Workers running under showPerDevice buffer their lines on their own
+    # thread for ordered replay once every device has finished
+    buffer = getattr(_TLS, 'print_buffer', None)
+    if buffer is not None:
+        buffer.append(logstr + '\n')
+        return
+    # Force thread safe printing
+    with _PRINT_LOCK:
+        try:
+            # One write per record; flushing is deferred to flushLog so a
+            # multi-line section costs one syscall per line, not two
+            sys.stdout.write(logstr + '\n')
+        # The CLI installs the default SIGPIPE handler, so a broken pipe
+        # normally kills the process before this fires; keep the except as
+        # a fallback for library use where no handler was installed
+        except(BrokenPipeError, IOError):
+            sys.exit(1)  # Python exits with error code 1 on EPIPE
+
+
+def flushLog():
+    """ Flush any buffered SMI log output to stdout """
     try:
-        if extraSpace:
-            print('\n', end='')
-        print(logstr + '\n', end='')
         sys.stdout.flush()
-    # when piped into programs like 'head' - print throws an error.
-    # silently ignore instead
     except(BrokenPipeError, IOError):
-        # https://docs.python.org/3/library/signal.html#note-on-sigpipe
-        # Python flushes standard streams on exit; redirect remaining output
-        # to devnull to avoid another BrokenPipeError at shutdown
-        devnull = os.open(os.devnull, os.O_WRONLY)
-        os.dup2(devnull, sys.stdout.fileno())
-        sys.exit(1)  # Python exits with error code 1 on EPIPE
-
-    lock.release()
+        sys.exit(1)
 
 
 def printListLog(metricName, valuesList):
@@ -870,6 +1173,10 @@ def printListLog(metricName, valuesList):
         print(listStr + line)
 
 
+# Full-width spacer fill strings, keyed (fill, width); keying on the width
+# keeps the cache correct when appWidth is resized for concise output
+_SPACER_CACHE = {}
+
 def printLogSpacer(displayString=None, fill='=', contentSizeToFit=0):
     """ Prints [name of the option]/[name of the program] in the spacer to explain data below
 
@@ -892,13 +1199,19 @@ def printLogSpacer(displayString=None, fill='=', contentSizeToFit=0):
     #       "; contentSizeToFit=" + str(contentSizeToFit) + "; fill=" + fill)
 
     if not PRINT_JSON:
+        # Reuse the full-width fill string; sections print many spacers and
+        # the string multiply repeated the same work every time
+        key = (fill, resizeValue)
+        fullFill = _SPACER_CACHE.get(key)
+        if fullFill is None:
+            fullFill = _SPACER_CACHE[key] = fill * resizeValue
         if displayString:
             if len(displayString) % 2:
                 displayString += fill
-            logSpacer = fill * int((resizeValue - (len(displayString))) / 2) + displayString + fill * int(
-                    (resizeValue - (len(displayString))) / 2)
+            sideFill = fullFill[:int((resizeValue - (len(displayString))) / 2) * len(fill)]
+            logSpacer = sideFill + displayString + sideFill
         else:
-            logSpacer = fill * resizeValue
+            logSpacer = fullFill
         print(logSpacer)
 
 
@@ -910,8 +1223,7 @@ def printSysLog(SysComponentName, value):
     """
     global PRINT_JSON, JSON_DATA
     if PRINT_JSON:
-        if 'system' not in JSON_DATA:
-            JSON_DATA['system'] = {}
+        JSON_DATA.setdefault('system', {})
         formatJson('system', str(SysComponentName) + ': ' + str(value))
         return
 
@@ -920,6 +1232,16 @@ def printSysLog(SysComponentName, value):
     print(logstr)
 
 
+def suppressTextOutput():
+    """ Return true when plain-text output is suppressed (JSON/CSV mode)
+
+        Callers that gather data purely to feed printTableLog can check
+        this before issuing their driver queries; the table printer drops
+        the output anyway in these modes.
+    """
+    return OUTPUT_SERIALIZATION or PRINT_JSON
+
+
 def printTableLog(column_headers, data_matrix, device=None, tableName=None, anchor='>', v_delim='  '):
     """ Print out to the SMI log for the lists
 
@@ -938,23 +1260,30 @@ def printTableLog(column_headers, data_matrix, device=None, tableName=None, anch
     if OUTPUT_SERIALIZATION or PRINT_JSON:
         return
 
+    # Build the whole table and emit it in one write; per-cell print calls
+    # each took the stdio lock and issued their own syscall
+    parts = []
     if (device is not None) or tableName:
         if device is not None:
-            print('\nGPU[%s]: ' % (device), end='\t')
+            parts.append('\nGPU[%s]: \t' % (device))
         if tableName:
-            print(tableName, end='')
-        printEmptyLine()
+            parts.append(tableName)
+        parts.append('\n')
 
     for header in column_headers:
-        print('{:>}'.format(header), end=v_delim)
-    printEmptyLine()
+        parts.append('{:>}'.format(header) + v_delim)
+    parts.append('\n')
 
+    # Pre-build one format string per column; the spec was re-parsed for
+    # every cell before
+    columnFormats = ['{:%s%d}' % (anchor, len(header)) for header in column_headers]
     for row in data_matrix:
         for index, cell in enumerate(row):
             if cell is None:
                 cell = 'None'
-            print('{:{anc}{width}}'.format(cell, anc=anchor, width=len(column_headers[index])), end=v_delim)
-        printEmptyLine()
+            parts.append(columnFormats[index].format(cell) + v_delim)
+        parts.append('\n')
+    sys.stdout.write(''.join(parts))
 
 
 def printTableRow(space, displayString, v_delim=" "):
@@ -970,6 +1299,7 @@ def printTableRow(space, displayString, v_delim=" "):
         print(displayString, end=v_delim)
 
 
+@memoizeStaticGetter
 def checkIfSecondaryDie(device):
     """ Checks if GCD(die) is the secondary die in a MCM.
     MI200 device specific feature check.
@@ -997,22 +1327,32 @@ def resetClocks(deviceList):
     :param deviceList: List of DRM devices (can be a single-item list)
     """
     printLogSpacer(' Reset Clocks ')
-    for device in deviceList:
-        ret = rocmsmi.rsmi_dev_overdrive_level_set(device, rsmi_dev_perf_level_t(0))
+    perfLevelAuto = rsmi_dev_perf_level_t(0)
+
+    # Each device is reset independently, so fan the kernel round-trips out
+    # over the device pool and print in device order once all have finished
+    def resetOne(device):
+        messages = []
+        ret = rocmsmi.rsmi_dev_overdrive_level_set(device, perfLevelAuto)
         if rsmi_ret_ok(ret, device, 'set_overdrive_level'):
-            printLog(device, 'OverDrive set to 0', None)
-        else:
-            printLog(device, 'Unable to reset OverDrive', None)
-        ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(0))
-        if rsmi_ret_ok(ret, device, 'set_perf_level'):
-            printLog(device, 'Successfully reset clocks', None)
+            messages.append('OverDrive set to 0')
         else:
-            printLog(device, 'Unable to reset clocks', None)
-        ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(0))
+            messages.append('Unable to reset OverDrive')
+        # One set call covers both messages; the second identical call that
+        # used to follow only repeated the same driver round-trip
+        ret = rocmsmi.rsmi_dev_perf_level_set(device, perfLevelAuto)
         if rsmi_ret_ok(ret, device, 'set_perf_level'):
-            printLog(device, 'Performance level reset to auto', None)
+            messages.append('Successfully reset clocks')
+            messages.append('Performance level reset to auto')
         else:
-            printLog(device, 'Unable to reset performance level to auto', None)
+            messages.append('Unable to reset clocks')
+            messages.append('Unable to reset performance level to auto')
+        return messages
+
+    deviceMessages = mapDevices(resetOne, deviceList)
+    for device in deviceList:
+        for message in deviceMessages[device]:
+            printLog(device, message, None)
 
 
 def resetFans(deviceList):
@@ -1021,13 +1361,17 @@ def resetFans(deviceList):
     :param deviceList: List of DRM devices (can be a single-item list)
     """
     printLogSpacer(' Reset GPU Fan Speed ')
-    for device in deviceList:
-        sensor_ind = c_uint32(0)
-        ret = rocmsmi.rsmi_dev_fan_reset(device, sensor_ind)
+    sensorInd = c_uint32(0)
+
+    def resetOne(device):
+        ret = rocmsmi.rsmi_dev_fan_reset(device, sensorInd)
         if rsmi_ret_ok(ret, device, silent=True):
-            printLog(device, 'Successfully reset fan speed to driver control', None)
-        else:
-            printLog(device, 'Not supported on the given system', None)
+            return 'Successfully reset fan speed to driver control'
+        return 'Not supported on the given system'
+
+    deviceMessages = mapDevices(resetOne, deviceList)
+    for device in deviceList:
+        printLog(device, deviceMessages[device], None)
     printLogSpacer()
 
 
@@ -1045,17 +1389,29 @@ def resetProfile(deviceList):
     :param deviceList: List of DRM devices (can be a single-item list)
     """
     printLogSpacer(' Reset Profile ')
-    for device in deviceList:
+    perfLevelAuto = rsmi_dev_perf_level_t(0)
+
+    def resetOne(device):
+        messages = []
         ret = rocmsmi.rsmi_dev_power_profile_set(device, 0, profileString('BOOTUP DEFAULT'))
         if rsmi_ret_ok(ret, device, 'set_power_profile'):
-            printLog(device, 'Successfully reset Power Profile', None)
+            messages.append((False, 'Successfully reset Power Profile'))
         else:
-            printErrLog(device, 'Unable to reset Power Profile')
-        ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(0))
+            messages.append((True, 'Unable to reset Power Profile'))
+        ret = rocmsmi.rsmi_dev_perf_level_set(device, perfLevelAuto)
         if rsmi_ret_ok(ret, device, 'set_perf_level'):
-            printLog(device, 'Successfully reset Performance Level', None)
+            messages.append((False, 'Successfully reset Performance Level'))
         else:
-            printErrLog(device, 'Unable to reset Performance Level')
+            messages.append((True, 'Unable to reset Performance Level'))
+        return messages
+
+    deviceMessages = mapDevices(resetOne, deviceList)
+    for device in deviceList:
+        for isError, message in deviceMessages[device]:
+            if isError:
+                printErrLog(device, message)
+            else:
+                printLog(device, message, None)
     printLogSpacer()
 
 
@@ -1065,9 +1421,14 @@ def resetXgmiErr(deviceList):
     :param deviceList: Reset XGMI error count for these devices
     """
     printLogSpacer('Reset XGMI Error Status ')
-    for device in deviceList:
+
+    def resetOne(device):
         ret = rocmsmi.rsmi_dev_xgmi_error_reset(device)
-        if rsmi_ret_ok(ret, device, 'reset xgmi'):
+        return rsmi_ret_ok(ret, device, 'reset xgmi')
+
+    deviceOk = mapDevices(resetOne, deviceList)
+    for device in deviceList:
+        if deviceOk[device]:
             printLog(device, 'Successfully reset XGMI Error count', None)
         else:
             logging.error('GPU[%s]\t\t: Unable to reset XGMI error count', device)
@@ -1080,9 +1441,15 @@ def resetPerfDeterminism(deviceList):
     :param deviceList: Disable Performance Determinism for these devices
     """
     printLogSpacer('Disable Performance Determinism')
+    perfLevelAuto = rsmi_dev_perf_level_t(0)
+
+    def resetOne(device):
+        ret = rocmsmi.rsmi_dev_perf_level_set(device, perfLevelAuto)
+        return rsmi_ret_ok(ret, device, 'disable performance determinism')
+
+    deviceOk = mapDevices(resetOne, deviceList)
     for device in deviceList:
-        ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(0))
-        if rsmi_ret_ok(ret, device, 'disable performance determinism'):
+        if deviceOk[device]:
             printLog(device, 'Successfully disabled performance determinism', None)
         else:
             logging.error('GPU[%s]\t\t: Unable to disable performance determinism', device)
@@ -1098,6 +1465,7 @@ def resetComputePartition(deviceList):
     for device in deviceList:
         originalPartition = getComputePartition(device)
         ret = rocmsmi.rsmi_dev_compute_partition_reset(device)
+        getComputePartition.invalidate(device)
         if rsmi_ret_ok(ret, device, 'reset_compute_partition', silent=True):
             resetBootState = getComputePartition(device)
             printLog(device, "Successfully reset compute partition (" +
@@ -1124,17 +1492,14 @@ def resetMemoryPartition(deviceList):
     printLogSpacer(" Reset memory partition to its boot state ")
     for device in deviceList:
         originalPartition = getMemoryPartition(device)
-        t1 = multiprocessing.Process(target=showProgressbar,
-                            args=("Resetting memory partition",13,))
-        t1.start()
+        stopProgress = startProgressbar("Resetting memory partition")
         addExtraLine=True
         start=time.time()
         ret = rocmsmi.rsmi_dev_memory_partition_reset(device)
+        getMemoryPartition.invalidate(device)
         stop=time.time()
         duration=stop-start
-        if t1.is_alive():
-            t1.terminate()
-            t1.join()
+        stopProgress()
         if duration < float(0.1):   # For longer runs, add extra line before output
             addExtraLine=False      # This is to prevent overriding progress bar
         if rsmi_ret_ok(ret, device, 'reset_memory_partition', silent=True):
@@ -1171,7 +1536,7 @@ def setClockRange(deviceList, clkType, minvalue, maxvalue, autoRespond):
         RETCODE = 1
         return
     try:
-        int(minvalue) & int(maxvalue)
+        minValue, maxValue = int(minvalue), int(maxvalue)
     except ValueError:
         printErrLog(None, 'Unable to set %s range' % (clkType))
         logging.error('%s or %s is not an integer', minvalue, maxvalue)
@@ -1180,7 +1545,7 @@ def setClockRange(deviceList, clkType, minvalue, maxvalue, autoRespond):
     confirmOutOfSpecWarning(autoRespond)
     printLogSpacer(' Set Valid %s Range ' % (clkType))
     for device in deviceList:
-        ret = rocmsmi.rsmi_dev_clk_range_set(device, int(minvalue), int(maxvalue), rsmi_clk_names_dict[clkType])
+        ret = rocmsmi.rsmi_dev_clk_range_set(device, minValue, maxValue, rsmi_clk_names_dict[clkType])
         if rsmi_ret_ok(ret, device, silent=True):
             printLog(device, 'Successfully set %s from %s(MHz) to %s(MHz)' % (clkType, minvalue, maxvalue), None)
         else:
@@ -1223,8 +1588,12 @@ def setClockExtremum(deviceList, level,  clkType, clkValue, autoRespond):
         return
     confirmOutOfSpecWarning(autoRespond)
     printLogSpacer(' Set Valid %s Extremum ' % (clkType))
+    # Loop-invariant ctypes arguments are built once, not per device
+    freqInd = rsmi_freq_ind_t(int(point))
+    clkValue = int(clkValue)
+    clkName = rsmi_clk_names_dict[clkType]
     for device in deviceList:
-        ret = rocmsmi.rsmi_dev_clk_extremum_set(device, rsmi_freq_ind_t(int(point)), int(clkValue), rsmi_clk_names_dict[clkType])
+        ret = rocmsmi.rsmi_dev_clk_extremum_set(device, freqInd, clkValue, clkName)
         if rsmi_ret_ok(ret, device, silent=True):
             printLog(device, 'Successfully set %s %s to %s(MHz)' % (level, clkType, clkValue), None)
         else:
@@ -1244,17 +1613,17 @@ def setVoltageCurve(deviceList, point, clk, volt, autoRespond):
     :param autoRespond: Response to automatically provide for all prompts
     """
     global RETCODE
-    value = '%s %s %s' % (point, clk, volt)
     try:
-        any(int(item) for item in value.split())
+        pointInt, clkInt, voltInt = int(point), int(clk), int(volt)
     except ValueError:
         printErrLog(None, 'Unable to set Voltage curve')
-        printErrLog(None, 'Non-integer characters are present in %s' %value)
+        printErrLog(None, 'Non-integer characters are present in %s %s %s'
+                    % (point, clk, volt))
         RETCODE = 1
         return
     confirmOutOfSpecWarning(autoRespond)
     for device in deviceList:
-        ret = rocmsmi.rsmi_dev_od_volt_info_set(device, int(point), int(clk), int(volt))
+        ret = rocmsmi.rsmi_dev_od_volt_info_set(device, pointInt, clkInt, voltInt)
         if rsmi_ret_ok(ret, device, 'set_voltage_curve'):
             printLog(device, 'Successfully set voltage point %s to %s(MHz) %s(mV)' % (point, clk, volt), None)
         else:
@@ -1273,29 +1642,29 @@ def setPowerPlayTableLevel(deviceList, clkType, point, clk, volt, autoRespond):
     :param autoRespond: Response to automatically provide for all prompts
     """
     global RETCODE
-    value = '%s %s %s' % (point, clk, volt)
-    listOfValues = value.split(' ')
     try:
-        any(int(item) for item in value.split())
+        pointInt, clkInt, voltInt = int(point), int(clk), int(volt)
     except ValueError:
         printErrLog(None, 'Unable to set PowerPlay table level')
-        printErrLog(None, 'Non-integer characters are present in %s' %value)
+        printErrLog(None, 'Non-integer characters are present in %s %s %s'
+                    % (point, clk, volt))
         RETCODE = 1
         return
     confirmOutOfSpecWarning(autoRespond)
+    freqInd = rsmi_freq_ind_t(pointInt)
     for device in deviceList:
         if clkType == 'sclk':
-            ret = rocmsmi.rsmi_dev_od_clk_info_set(device, rsmi_freq_ind_t(int(point)), int(clk),
+            ret = rocmsmi.rsmi_dev_od_clk_info_set(device, freqInd, clkInt,
                                                    rsmi_clk_names_dict[clkType])
-            if rsmi_ret_ok(ret, device, 'set_power_play_table_level_' + str(clkType)):
+            if rsmi_ret_ok(ret, device, ('set_power_play_table_level_', clkType)):
                 printLog(device, 'Successfully set voltage point %s to %s(MHz) %s(mV)' % (point, clk, volt), None)
             else:
                 printErrLog(device, 'Unable to set voltage point %s to %s(MHz) %s(mV)' % (point, clk, volt))
                 RETCODE = 1
         elif clkType == 'mclk':
-            ret = rocmsmi.rsmi_dev_od_clk_info_set(device, rsmi_freq_ind_t(int(point)), int(clk),
+            ret = rocmsmi.rsmi_dev_od_clk_info_set(device, freqInd, clkInt,
                                                    rsmi_clk_names_dict[clkType])
-            if rsmi_ret_ok(ret, device, 'set_power_play_table_level_' + str(clkType)):
+            if rsmi_ret_ok(ret, device, ('set_power_play_table_level_', clkType)):
                 printLog(device, 'Successfully set voltage point %s to %s(MHz) %s(mV)' % (point, clk, volt), None)
             else:
                 printErrLog(device, 'Unable to set voltage point %s to %s(MHz) %s(mV)' % (point, clk, volt))
@@ -1316,6 +1685,7 @@ def setClockOverDrive(deviceList, clktype, value, autoRespond):
     """
     printLogSpacer(' Set Clock OverDrive (Range: 0% to 20%) ')
     global RETCODE
+    perfLevelManual = rsmi_dev_perf_level_t(3)
     try:
         int(value)
     except ValueError:
@@ -1335,13 +1705,13 @@ def setClockOverDrive(deviceList, clktype, value, autoRespond):
             logging.debug('OverDrive cannot be set to a value greater than 20%')
             value = '20'
         if getPerfLevel(device) != 'MANUAL':
-            ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(3))
-            if rsmi_ret_ok(ret, device, 'set_perf_level_manual_' + str(clktype)):
+            ret = rocmsmi.rsmi_dev_perf_level_set(device, perfLevelManual)
+            if rsmi_ret_ok(ret, device, ('set_perf_level_manual_', clktype)):
                 printLog(device, 'Performance level set to manual', None)
             else:
                 printErrLog(device, 'Unable to set performance level to manual')
         if clktype == 'mclk':
-            fsFile = os.path.join('/sys/class/drm', 'card%d' % (device), 'device', 'pp_mclk_od')
+            fsFile = '/sys/class/drm/card%d/device/pp_mclk_od' % (device)
             if not os.path.isfile(fsFile):
                 printLog(None, 'Unable to write to sysfs file (' + fsFile +
                          '), file does not exist', None)
@@ -1359,7 +1729,7 @@ def setClockOverDrive(deviceList, clktype, value, autoRespond):
             printLog(device, 'Successfully set %s OverDrive to %s%%' % (clktype, value), None)
         elif clktype == 'sclk':
             ret = rocmsmi.rsmi_dev_overdrive_level_set(device, rsmi_dev_perf_level_t(int(value)))
-            if rsmi_ret_ok(ret, device, 'set_overdrive_level_' + str(clktype)):
+            if rsmi_ret_ok(ret, device, ('set_overdrive_level_', clktype)):
                 printLog(device, 'Successfully set %s OverDrive to %s%%' % (clktype, value), None)
             else:
                 printLog(device, 'Unable to set %s OverDrive to %s%%' % (clktype, value), None)
@@ -1381,35 +1751,36 @@ def setClocks(deviceList, clktype, clk):
         printLog(None, 'Invalid clock frequency', None)
         RETCODE = 1
         return
-    if clktype not in validClockNames:
+    if clktype not in VALID_CLOCK_SET:
         printErrLog(None, 'Unable to set clock level')
         logging.error('Invalid clock type %s', clktype)
         RETCODE = 1
         return
-    check_value = ''.join(map(str, clk))
-    try:
-        int(check_value)
-    except ValueError:
-        printLog(None, 'Unable to set clock level', None)
-        logging.error('Non-integer characters are present in value %s', check_value)
-        RETCODE = 1
-        return
-    # Generate a frequency bitmask from user input value
+    # Validate each level and build the frequency bitmask in one pass; the
+    # old check joined all levels into one string just to int() it
     freq_bitmask = 0
     for bit in clk:
-        if bit > 63:
+        try:
+            bit = int(bit)
+        except (TypeError, ValueError):
+            printLog(None, 'Unable to set clock level', None)
+            logging.error('Non-integer characters are present in value %s', bit)
+            RETCODE = 1
+            return
+        if not 0 <= bit <= 63:
             printErrLog(None, 'Invalid clock frequency')
             logging.error('Invalid frequency: %s', bit)
             RETCODE = 1
             return
-
         freq_bitmask |= (1 << bit)
 
     printLogSpacer(' Set %s Frequency ' % (str(clktype)))
+    perfLevelManual = rsmi_dev_perf_level_t(3)
     for device in deviceList:
         # Check if the performance level is manual, if not then set it to manual
-        if getPerfLevel(device).lower() != 'manual':
-            ret = rocmsmi.rsmi_dev_perf_level_set(device, rsmi_dev_perf_level_t(3))
+        perfLevel = getPerfLevel(device).lower()
+        if perfLevel != 'manual':
+            ret = rocmsmi.rsmi_dev_perf_level_set(device, perfLevelManual)
             if rsmi_ret_ok(ret, device, 'set_perf_level_manual'):
                 printLog(device, 'Performance level was set to manual', None)
             else:
@@ -1420,7 +1791,7 @@ def setClocks(deviceList, clktype, clk):
             # Validate frequency bitmask
             freq = rsmi_frequencies_t()
             ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clktype], byref(freq))
-            if rsmi_ret_ok(ret, device, 'get_gpu_clk_freq_' + str(clktype)) == False:
+            if rsmi_ret_ok(ret, device, ('get_gpu_clk_freq_', clktype)) == False:
                 RETCODE = 1
                 return
             # The freq_bitmask should be less than 2^(freqs.num_supported)
@@ -1431,7 +1802,7 @@ def setClocks(deviceList, clktype, clk):
                 return
 
             ret = rocmsmi.rsmi_dev_gpu_clk_freq_set(device, rsmi_clk_names_dict[clktype], freq_bitmask)
-            if rsmi_ret_ok(ret, device, 'set_gpu_clk_freq_' + str(clktype)):
+            if rsmi_ret_ok(ret, device, ('set_gpu_clk_freq_', clktype)):
                 printLog(device, 'Successfully set %s bitmask to' % (clktype), hex(freq_bitmask))
             else:
                 printErrLog(device, 'Unable to set %s bitmask to: %s' % (clktype, hex(freq_bitmask)))
@@ -1508,20 +1879,29 @@ def resetGpu(device):
     printLogSpacer()
 
 
+# Formatted debugfs paths, built once per device
+_RAS_CTRL_PATHS = {}
+
 def isRasControlAvailable(device):
     """ Check if RAS control is available for a specified device.
 
+    Returns (available, path) so callers can reuse the resolved ras_ctrl
+    path instead of rebuilding and re-stat()ing it.
+
     :param device: DRM device identifier
     """
 
-    path = os.path.join('/sys/kernel/debug/dri', 'card%d' % device, 'device', 'ras_ctrl')
+    path = _RAS_CTRL_PATHS.get(device)
+    if path is None:
+        path = _RAS_CTRL_PATHS[device] = \
+            '/sys/kernel/debug/dri/card%d/device/ras_ctrl' % device
 
-    if not doesDeviceExist(device) or not path or not os.path.isfile(path):
+    if not doesDeviceExist(device) or not os.path.isfile(path):
         logging.warning('GPU[%s]\t: RAS control is not available')
 
-        return False
+        return False, None
 
-    return True
+    return True, path
 
 
 def setRas(deviceList, rasAction, rasBlock, rasType):
@@ -1552,19 +1932,21 @@ def setRas(deviceList, rasAction, rasBlock, rasType):
     printLogSpacer()
     # NOTE PSP FW doesn't support enabling disabled counters yet
     for device in deviceList:
-        if isRasControlAvailable(device):
-            rasFilePath = path = os.path.join('/sys/kernel/debug/dri', 'card%d' % device, 'device', 'ras_ctrl')
+        rasAvailable, rasFilePath = isRasControlAvailable(device)
+        if rasAvailable:
             rasCmd = '%s %s %s' % (rasAction, rasBlock, rasType)
 
             # writeToSysfs analog to old cli
-            if not os.path.isfile(rasFilePath):
-                printLog(None, 'Unable to write to sysfs file', None)
-                logging.debug('%s does not exist', rasFilePath)
-                return False
             try:
                 logging.debug('Writing value \'%s\' to file \'%s\'', rasCmd, rasFilePath)
-                with open(rasFilePath, 'w') as fs:
-                    fs.write(rasFilePath + '\n')  # Certain sysfs files require \n at the end
+                fd = os.open(rasFilePath, os.O_WRONLY)
+                try:
+                    # Certain sysfs files require \n at the end
+                    os.write(fd, (rasCmd + '\n').encode())
+                finally:
+                    os.close(fd)
+                # The enablement state we cached for this block is now stale
+                _RAS_STATE_CACHE.pop((device, rasBlock), None)
             except (IOError, OSError):
                 printLog(None, 'Unable to write to sysfs file %s' % rasFilePath, None)
                 logging.warning('IO or OS error')
@@ -1582,17 +1964,17 @@ def setFanSpeed(deviceList, fan):
     :param level: [0-255] Fan speed level
     """
     printLogSpacer(' Set GPU Fan Speed ')
-    for device in deviceList:
-        if str(fan):
-            fanLevel = c_int64()
-            last_char = str(fan)[-1]
-            if last_char == '%':
-                fanLevel = int(str(fan)[:-1]) / 100 * 255
-            else:
-                fanLevel = int(str(fan))
-            ret = rocmsmi.rsmi_dev_fan_speed_set(device, 0, int(fanLevel))
+    # The requested speed is the same for every device; parse it once
+    fanString = str(fan)
+    if fanString:
+        if fanString[-1] == '%':
+            fanLevel = int(fanString[:-1]) * 255 // 100
+        else:
+            fanLevel = int(fanString)
+        for device in deviceList:
+            ret = rocmsmi.rsmi_dev_fan_speed_set(device, 0, fanLevel)
             if rsmi_ret_ok(ret, device, silent=True):
-                printLog(device, 'Successfully set fan speed to level %s' % (str(int(fanLevel))), None)
+                printLog(device, 'Successfully set fan speed to level %s' % (fanLevel), None)
             else:
                 printLog(device, 'Not supported on the given system', None)
     printLogSpacer()
@@ -1628,15 +2010,16 @@ def setPowerOverDrive(deviceList, value, autoRespond):
     """
     global RETCODE, PRINT_JSON
     try:
-        int(value)
+        intValue = int(value)
     except ValueError:
         printLog(None, 'Unable to set Power OverDrive', None)
         logging.error('%s is not an integer', value)
         RETCODE = 1
         return
     # Wattage input value converted to microWatt for ROCm SMI Lib
+    targetPowerCap = intValue * 1000000
 
-    if int(value) == 0:
+    if intValue == 0:
         printLogSpacer(' Reset GPU Power OverDrive ')
     else:
         printLogSpacer(' Set GPU Power OverDrive ')
@@ -1644,16 +2027,22 @@ def setPowerOverDrive(deviceList, value, autoRespond):
     # Value in Watts - stored early this way to avoid strenuous value type conversions
     strValue = value
     specWarningConfirmed = False
+    # One set of ctypes slots reused across the loop; the library overwrites
+    # them on each read and stale values are cleared below
+    power_cap_min = c_uint64()
+    power_cap_max = c_uint64()
+    current_power_cap = c_uint64()
+    default_power_cap = c_uint64()
+    new_power_cap = c_uint64()
     for device in deviceList:
         # Continue to next device in deviceList loop if the device is a secondary die
         if checkIfSecondaryDie(device):
             logging.debug("Unavailable for secondary die.")
             continue
-        power_cap_min = c_uint64()
-        power_cap_max = c_uint64()
-        current_power_cap = c_uint64()
-        default_power_cap = c_uint64()
-        new_power_cap = c_uint64()
+        current_power_cap.value = 0
+        default_power_cap.value = 0
+        power_cap_min.value = 0
+        power_cap_max.value = 0
 
         ret = rocmsmi.rsmi_dev_power_cap_get(device, 0, byref(current_power_cap))
         if ret != 0:
@@ -1665,26 +2054,27 @@ def setPowerOverDrive(deviceList, value, autoRespond):
             ret = rocmsmi.rsmi_dev_power_cap_set(device, 0, 0)
             ret = rocmsmi.rsmi_dev_power_cap_get(device, 0, byref(default_power_cap))
 
-        if int(value) == 0:
+        if intValue == 0:
             new_power_cap = default_power_cap
         else:
-            new_power_cap.value = int(value) * 1000000
-
-        ret = rocmsmi.rsmi_dev_power_cap_range_get(device, 0, byref(power_cap_max), byref(power_cap_min))
-        if rsmi_ret_ok(ret, device, 'get_power_cap_range') == False:
-            printErrLog(device, 'Unable to parse Power OverDrive range')
-            RETCODE = 1
-            continue
-        if int(strValue) > (power_cap_max.value / 1000000):
-            printErrLog(device, 'Unable to set Power OverDrive')
-            logging.error('GPU[%s]\t\t: Value cannot be greater than: %dW ', device, power_cap_max.value / 1000000)
-            RETCODE = 1
-            continue
-        if int(strValue) < (power_cap_min.value / 1000000):
-            printErrLog(device, 'Unable to set Power OverDrive')
-            logging.error('GPU[%s]\t\t: Value cannot be less than: %dW ', device, power_cap_min.value / 1000000)
-            RETCODE = 1
-            continue
+            new_power_cap.value = targetPowerCap
+            # The reset path pins the cap to the default, which needs no
+            # range validation; only query the range for explicit values
+            ret = rocmsmi.rsmi_dev_power_cap_range_get(device, 0, byref(power_cap_max), byref(power_cap_min))
+            if rsmi_ret_ok(ret, device, 'get_power_cap_range') == False:
+                printErrLog(device, 'Unable to parse Power OverDrive range')
+                RETCODE = 1
+                continue
+            if intValue > (power_cap_max.value / 1000000):
+                printErrLog(device, 'Unable to set Power OverDrive')
+                logging.error('GPU[%s]\t\t: Value cannot be greater than: %dW ', device, power_cap_max.value / 1000000)
+                RETCODE = 1
+                continue
+            if intValue < (power_cap_min.value / 1000000):
+                printErrLog(device, 'Unable to set Power OverDrive')
+                logging.error('GPU[%s]\t\t: Value cannot be less than: %dW ', device, power_cap_min.value / 1000000)
+                RETCODE = 1
+                continue
         if new_power_cap.value == current_power_cap.value:
             printLog(device,'Max power was already at: {}W'.format(new_power_cap.value / 1000000))
 
@@ -1696,11 +2086,12 @@ def setPowerOverDrive(deviceList, value, autoRespond):
 
         ret = rocmsmi.rsmi_dev_power_cap_set(device, 0, new_power_cap)
         if rsmi_ret_ok(ret, device, 'set_power_cap'):
-            if int(value) == 0:
-                power_cap = c_uint64()
-                ret = rocmsmi.rsmi_dev_power_cap_get(device, 0, byref(power_cap))
-                if rsmi_ret_ok(ret, device, 'get_power_cap'):
-                    if not PRINT_JSON:
+            if intValue == 0:
+                # The confirm read only feeds the human-readable message
+                if not PRINT_JSON:
+                    power_cap = c_uint64()
+                    ret = rocmsmi.rsmi_dev_power_cap_get(device, 0, byref(power_cap))
+                    if rsmi_ret_ok(ret, device, 'get_power_cap'):
                         printLog(device,
                                  'Successfully reset Power OverDrive to: %sW' % (int(power_cap.value / 1000000)), None)
             else:
@@ -1712,7 +2103,7 @@ def setPowerOverDrive(deviceList, value, autoRespond):
                         printErrLog(device, 'Unable set power to: %sW, current value is %sW' % \
                                     (strValue, int(current_power_cap.value / 1000000)))
         else:
-            if int(value) == 0:
+            if intValue == 0:
                 printErrLog(device, 'Unable to reset Power OverDrive to default')
             else:
                 printErrLog(device, 'Unable to set Power OverDrive to ' + strValue + 'W')
@@ -1727,26 +2118,27 @@ def setProfile(deviceList, profile):
     """
     printLogSpacer(' Set Power Profile ')
     status = rsmi_power_profile_status_t()
+    # The target profile is the same for every device; resolve it once
+    profileStr = str(profile)
+    if profileStr.isnumeric() and 0 < int(profileStr) < 8:
+        desiredProfile = profileString(2 ** (int(profileStr) - 1))
+    elif str(profileString(profileStr.replace('_', ' ').upper())).isnumeric():
+        desiredProfile = profileStr.replace('_', ' ').upper()
+    else:
+        printErrLog(None, 'Unable to set profile to: %s (UNKNOWN profile)' % (profileStr))
+        return
+    desiredProfileValue = profileString(desiredProfile)
     for device in deviceList:
         # Get previous profile
         ret = rocmsmi.rsmi_dev_power_profile_presets_get(device, 0, byref(status))
         if rsmi_ret_ok(ret, device, 'get_power_profile'):
             previousProfile = profileString(status.current)
-            # Get desired profile
-            desiredProfile = 'UNKNOWN'
-            if str(profile).isnumeric() and int(profile) > 0 and int(profile) < 8:
-                desiredProfile = profileString(2 ** (int(profile) - 1))
-            elif str(profileString(str(profile).replace('_', ' ').upper())).isnumeric():
-                desiredProfile = str(profile).replace('_', ' ').upper()
-            else:
-                printErrLog(device, 'Unable to set profile to: %s (UNKNOWN profile)' % (str(profile)))
-                return
             # Set profile to desired profile
             if previousProfile == desiredProfile:
                 printLog(device, 'Profile was already set to', previousProfile)
                 return
             else:
-                ret = rocmsmi.rsmi_dev_power_profile_set(device, 0, profileString(desiredProfile))
+                ret = rocmsmi.rsmi_dev_power_profile_set(device, 0, desiredProfileValue)
                 if rsmi_ret_ok(ret, device, 'set_power_profile'):
                     # Get current profile
                     ret = rocmsmi.rsmi_dev_power_profile_presets_get(device, 0, byref(status))
@@ -1776,6 +2168,7 @@ def setComputePartition(deviceList, computePartitionType):
             return (None, None)
         ret = rocmsmi.rsmi_dev_compute_partition_set(device,
                 rsmi_compute_partition_type_dict[computePartitionType])
+        getComputePartition.invalidate(device)
         if rsmi_ret_ok(ret, device, 'set_compute_partition', silent=True):
             printLog(device,
                 'Successfully set compute partition to %s' % (computePartitionType),
@@ -1791,7 +2184,9 @@ def setComputePartition(deviceList, computePartitionType):
             printLog(device, 'Device is currently busy, try again later',
                      None)
         else:
-            rsmi_ret_ok(ret, device, 'set_compute_partition')
+            # The silent rsmi_ret_ok above already recorded RETCODE and the
+            # status string; replaying it non-silently only repeated the work
+            logging.debug('set_compute_partition returned %s for GPU[%s]', ret, device)
             printErrLog(device, 'Failed to retrieve compute partition, even though device supports it.')
     printLogSpacer()
 
@@ -1800,25 +2195,52 @@ def progressbar(it, prefix="", size=60, out=sys.stdout):
     count = len(it)
     def show(j):
         x = int(size*j/count)
-        lock = multiprocessing.Lock()
-        lock.acquire()
+        # A Lock() created per frame excludes nothing; the single writer
+        # needs no locking at all
         print("{}[{}{}] {}/{} secs remain".format(prefix, u"█"*x, "."*(size-x), j, count),
                 end='\r', file=out, flush=True)
-        lock.release()
     show(0)
     for i, item in enumerate(it):
         yield item
         show(i+1)
-    lock = multiprocessing.Lock()
-    lock.acquire()
     print("\n", flush=True, file=out)
-    lock.release()
 
-def showProgressbar(title="", timeInSeconds=13):
+def showProgressbar(title="", timeInSeconds=13, stopEvent=None):
+    """ Animate a progress bar, optionally until an event is set
+
+    :param title: Label printed ahead of the bar
+    :param timeInSeconds: Upper bound on the animation time
+    :param stopEvent: threading.Event that ends the animation early
+    """
     if title != "":
         title += ": "
     for i in progressbar(range(timeInSeconds), title, 40):
-        time.sleep(1)
+        if stopEvent is None:
+            time.sleep(1)
+        elif stopEvent.wait(1):
+            break
+
+
+def startProgressbar(title, timeInSeconds=13):
+    """ Start a progress bar on a background thread
+
+        A thread shares the interpreter, so starting it is microseconds;
+        the multiprocessing.Process used before forked a whole interpreter
+        per device, which often outweighed the driver call it decorated.
+        Returns a stop callable that ends the animation cleanly.
+
+    :param title: Label printed ahead of the bar
+    :param timeInSeconds: Upper bound on the animation time
+    """
+    stopEvent = threading.Event()
+    spinner = threading.Thread(target=showProgressbar,
+                               args=(title, timeInSeconds, stopEvent), daemon=True)
+    spinner.start()
+
+    def stop():
+        stopEvent.set()
+        spinner.join(0.2)
+    return stop
 
 
 def setMemoryPartition(deviceList, memoryPartition):
@@ -1837,18 +2259,15 @@ def setMemoryPartition(deviceList, memoryPartition):
                         (', '.join(map(str, memory_partition_type_l))) ))
             return (None, None)
 
-        t1 = multiprocessing.Process(target=showProgressbar,
-                            args=("Updating memory partition",13,))
-        t1.start()
+        stopProgress = startProgressbar("Updating memory partition")
         addExtraLine=True
         start=time.time()
         ret = rocmsmi.rsmi_dev_memory_partition_set(device,
             rsmi_memory_partition_type_dict[memoryPartition])
+        getMemoryPartition.invalidate(device)
         stop=time.time()
         duration=stop-start
-        if t1.is_alive():
-            t1.terminate()
-            t1.join()
+        stopProgress()
         if duration < float(0.1):   # For longer runs, add extra line before output
             addExtraLine=False      # This is to prevent overriding progress bar
 
@@ -1864,7 +2283,7 @@ def setMemoryPartition(deviceList, memoryPartition):
             printLog(device, 'Device is currently busy, try again later',
                      None, addExtraLine)
         else:
-            rsmi_ret_ok(ret, device, 'set_memory_partition')
+            logging.debug('set_memory_partition returned %s for GPU[%s]', ret, device)
             printErrLog(device, 'Failed to retrieve memory partition, even though device supports it.')
     printLogSpacer()
 
@@ -1878,22 +2297,39 @@ def showVersion(isCSV=False):
         values['ROCM-SMI-LIB version'] = version_string
 
     if isCSV:
-        print('name, value')
-        for k in values.keys():
-            print('%s, %s' % (k, values[k]))
+        print('\n'.join(['name, value'] + ['%s, %s' % kv for kv in values.items()]))
         return
     if PRINT_JSON:
-        temp_str = '{\n'
-        for k in values.keys():
-            temp_str += '  "%s": "%s",\n' % (k, values[k])
-        if len(values.keys()) > 1:
-            # replace ',\n' with '\n}'
-            temp_str = temp_str[:-2]
-        temp_str += '\n}'
-        print(temp_str)
+        # The C-level encoder also fixes the trailing comma the hand-rolled
+        # string build emitted for single-entry output
+        print(json.dumps(values, indent=2))
         return
-    for k in values.keys():
-        print('%s: %s' % (k, values[k]))
+    print('\n'.join('%s: %s' % kv for kv in values.items()))
+
+# Row templates keyed by column widths; watch-style reinvocations with a
+# stable device set reuse the same template instead of rebuilding it
+_ROW_FORMAT_CACHE = {}
+
+def rowFormatFor(max_widths):
+    """ Return a cached '{:<W}…' row template for the given column widths """
+    key = tuple(max_widths)
+    fmt = _ROW_FORMAT_CACHE.get(key)
+    if fmt is None:
+        fmt = _ROW_FORMAT_CACHE[key] = ''.join('{:<%d}' % width for width in max_widths)
+    return fmt
+
+
+def computeColumnWidths(head_widths, rows):
+    """ Return per-column widths that fit the headers and every row
+
+    Column-wise reduction over the transposed rows; one pass per column
+    instead of a Python-level loop per device per column.
+    """
+    if not rows:
+        return list(head_widths)
+    return [max(head_width, *(len(str(val)) + 2 for val in column))
+            for head_width, column in zip(head_widths, zip(*rows))]
+
 
 def showAllConcise(deviceList):
     """ Display critical info for all devices in a concise format
@@ -1928,9 +2364,10 @@ def showAllConcise(deviceList):
             if numSpacesToFill_header > 0:
                 header[idx] = header[idx] + (' ' * numSpacesToFill_header)
     head_widths = [len(head) + 2 for head in header]
-    values = {}
     degree_sign = u'\N{DEGREE SIGN}'
-    for device in deviceList:
+
+    def collectConciseInfo(device):
+        """ Gather one device's row of concise values (read-only) """
         temp_val = str(getTemp(device, available_temp_type, silent))
         if temp_val != 'N/A':
             temp_val += degree_sign + 'C'
@@ -1943,20 +2380,21 @@ def showAllConcise(deviceList):
         combined_partition_data = (getMemoryPartition(device, silent) + ", "
                              + getComputePartition(device, silent)
                              + ", " + getPartitionId(device, silent))
-        sclk = showCurrentClocks([device], 'sclk', concise=silent)
-        mclk = showCurrentClocks([device], 'mclk', concise=silent)
+        sclk = getCurrentClock(device, 'sclk', silent)
+        mclk = getCurrentClock(device, 'mclk', silent)
         (retCode, fanLevel, fanSpeed) = getFanSpeed(device, silent)
         fan = str(fanSpeed) + '%'
-        if getPerfLevel(device, silent) != -1:
-            perf = getPerfLevel(device, silent)
-        else:
+        perf = getPerfLevel(device, silent)
+        if perf == -1:
             perf = 'Unsupported'
-        if getMaxPower(device, silent) != -1:
-            pwrCap = str(getMaxPower(device, silent)) + 'W'
+        maxPower = getMaxPower(device, silent)
+        if maxPower != -1:
+            pwrCap = str(maxPower) + 'W'
         else:
             pwrCap = 'Unsupported'
-        if getGpuUse(device, silent) != -1:
-            gpu_busy = str(getGpuUse(device, silent)) + '%'
+        gpuUse = getGpuUse(device, silent)
+        if gpuUse != -1:
+            gpu_busy = str(gpuUse) + '%'
         else:
             gpu_busy = 'Unsupported'
         vram_used, vram_total = getMemInfo(device, 'vram', silent)
@@ -1969,29 +2407,27 @@ def showAllConcise(deviceList):
                                                           # values with no precision
 
         # Top Row - per device data
-        values['card%s' % (str(device))] = [device, getNodeId(device),
-                                            str(getDRMDeviceId(device)) + ", ",
-                                            str(getGUID(device)),
-                                            temp_val, powerVal, 
-                                            combined_partition_data,
-                                            sclk, mclk, fan, str(perf).lower(),
-                                            str(pwrCap),
-                                            str(mem_use_pct),
-                                            str(gpu_busy)]
-
-    val_widths = {}
-    for device in deviceList:
-        val_widths[device] = [len(str(val)) + 2 for val in values['card%s' % (str(device))]]
-    max_widths = head_widths
-    for device in deviceList:
-        for col in range(len(val_widths[device])):
-            max_widths[col] = max(max_widths[col], val_widths[device][col])
+        return [device, getNodeId(device),
+                str(getDRMDeviceId(device)) + ", ",
+                str(getGUID(device)),
+                temp_val, powerVal,
+                combined_partition_data,
+                sclk, mclk, fan, str(perf).lower(),
+                str(pwrCap),
+                str(mem_use_pct),
+                str(gpu_busy)]
+
+    # Reads are device-independent, so gather the rows in parallel
+    deviceRows = mapDevices(collectConciseInfo, deviceList)
+
+    max_widths = computeColumnWidths(head_widths, [deviceRows[device] for device in deviceList])
 
     ########################
     # Display concise info #
     ########################
-    header_output = "".join(word.ljust(max_widths[col]) for col, word in zip(range(len(max_widths)), header))
-    subheader_output = "".join(word.ljust(max_widths[col]) for col, word in zip(range(len(max_widths)), subheader))
+    rowFormat = rowFormatFor(max_widths)
+    header_output = rowFormat.format(*header)
+    subheader_output = rowFormat.format(*subheader)
     printLogSpacer(headerString, contentSizeToFit=len(header_output))
     printLogSpacer(' Concise Info ', contentSizeToFit=len(header_output))
     printLog(None, header_output, None)
@@ -1999,8 +2435,7 @@ def showAllConcise(deviceList):
     printLogSpacer(fill='=', contentSizeToFit=len(header_output))
 
     for device in deviceList:
-        printLog(None, "".join(str(word).ljust(max_widths[col]) for col, word in
-                               zip(range(len(max_widths)), values['card%s' % (str(device))])), None)
+        printLog(None, rowFormat.format(*map(str, deviceRows[device])), None)
 
     printLogSpacer(contentSizeToFit=len(header_output))
     printLogSpacer(footerString, contentSizeToFit=len(header_output))
@@ -2031,28 +2466,17 @@ def showAllConciseHw(deviceList):
         umcRas = getRasEnablement(device, 'UMC', silent)
         vbios = getVbiosVersion(device, silent)
         bus = getBus(device, silent)
-        values['card%s' % (str(device))] = [device, nodeid, did, guid, gfxVer, gfxRas, sdmaRas,
+        values[device] = [device, nodeid, did, guid, gfxVer, gfxRas, sdmaRas,
                                             umcRas, vbios, bus, partition_id]
-    val_widths = {}
-    for device in deviceList:
-        val_widths[device] = [len(str(val)) + 2 for val in values['card%s' % (str(device))]]
-    max_widths = head_widths
-    for device in deviceList:
-        for col in range(len(val_widths[device])):
-            max_widths[col] = max(max_widths[col], val_widths[device][col])
-    device_output=""
-    for device in deviceList:
-        if (device + 1 != len(deviceList)):
-            device_output += "".join(str(word).ljust(max_widths[col]) for col, word in
-                               zip(range(len(max_widths)), values['card%s' % (str(device))])) + "\n"
-        else:
-            device_output += "".join(str(word).ljust(max_widths[col]) for col, word in
-                               zip(range(len(max_widths)), values['card%s' % (str(device))]))
+    max_widths = computeColumnWidths(head_widths, [values[device] for device in deviceList])
+    rowFormat = rowFormatFor(max_widths)
+    device_output = "\n".join(rowFormat.format(*map(str, values[device]))
+                              for device in deviceList)
 
     #################################
     # Display concise hardware info #
     #################################
-    header_output = "".join(word.ljust(max_widths[col]) for col, word in zip(range(len(max_widths)), header))
+    header_output = rowFormat.format(*header)
     printLogSpacer(headerString, contentSizeToFit=len(header_output))
     printLogSpacer(' Concise Hardware Info ', contentSizeToFit=len(header_output))
     printLog(None, header_output, None)
@@ -2072,6 +2496,24 @@ def showBus(deviceList):
     printLogSpacer()
 
 
+# Whether a clock type is exposed never changes while the tool runs, so the
+# NULL-pointer support probe is remembered per (device, clock)
+_CLK_SUPPORT_CACHE = {}
+
+def isClockSupported(device, clk_type):
+    """ Return whether a clock type is exposed by a given device
+
+    :param device: DRM device identifier
+    :param clk_type: Clock type to probe
+    """
+    key = (device, clk_type)
+    supported = _CLK_SUPPORT_CACHE.get(key)
+    if supported is None:
+        supported = _CLK_SUPPORT_CACHE[key] = \
+            rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], None) == 1
+    return supported
+
+
 def showClocks(deviceList):
     """ Display all available clocks for a list of devices
 
@@ -2079,12 +2521,11 @@ def showClocks(deviceList):
 
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    freq = rsmi_frequencies_t()
-    bw = rsmi_pcie_bandwidth_t()
+    freq, bw = clockBuffers()
     printLogSpacer(' Supported clock frequencies ')
     for device in deviceList:
-        for clk_type in sorted(rsmi_clk_names_dict):
-            if rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], None) == 1:
+        for clk_type in SORTED_CLK_NAMES:
+            if isClockSupported(device, clk_type):
                 ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], byref(freq))
                 if ret == rsmi_status_t.RSMI_STATUS_UNEXPECTED_DATA:
                     printLog(device, 'Clock [%s] on device [%s] exists but EMPTY! Likely driver error!' % (clk_type, str(device)))
@@ -2096,16 +2537,9 @@ def showClocks(deviceList):
                     freq_string = '{:>.0f}Mhz'.format(freq.frequency[i] / 1000000)
                     if i == freq.current:
                         freq_string += ' *'
-                    freq_index = i
                     # Deep Sleep frequency is only supported by some GPUs
                     # It is indicated by letter 'S' instead of the index number
-                    if freq.has_deep_sleep:
-                        # sleep state
-                        if i == 0:
-                            freq_index = 'S'
-                        # all indices are offset by 1 because Deep Sleep occupies index 0
-                        else:
-                            freq_index = i - 1
+                    freq_index = resolveClockIndex(freq, i)
                     printLog(device, str(freq_index), freq_string)
                 printLog(device, '', None)
             else:
@@ -2116,7 +2550,7 @@ def showClocks(deviceList):
             if rsmi_ret_ok(ret, device, 'get_PCIe_bandwidth', True):
                 printLog(device, 'Supported %s frequencies on GPU%s' % ('PCIe', str(device)), None)
                 for i in range(bw.transfer_rate.num_supported):
-                    freq_string = '{:>.1f}GT/s x{}'.format(bw.transfer_rate.frequency[i] / 1000000000, bw.lanes[i])
+                    freq_string = '{:>.1f}GT/s x{}'.format(bw.transfer_rate.frequency[i] / 1e9, bw.lanes[i])
                     if i == bw.transfer_rate.current:
                         freq_string += ' *'
                     printLog(device, str(i), str(freq_string))
@@ -2128,6 +2562,43 @@ def showClocks(deviceList):
     printLogSpacer()
 
 
+def resolveClockIndex(freq, level):
+    """ Return the display index for a clock frequency level
+
+    Deep Sleep occupies index 0 when present, is shown as 'S', and shifts
+    the remaining indices down by one.
+
+    :param freq: rsmi_frequencies_t read for the clock
+    :param level: Raw level index reported by the library
+    """
+    if not freq.has_deep_sleep:
+        return level
+    return 'S' if level == 0 else level - 1
+
+
+def getCurrentClock(device, clock, silent=True):
+    """ Return the current frequency of a given clock as a 'NNNMhz' string
+
+    Scalar companion to showCurrentClocks for callers that only need the
+    value (e.g. the concise view) without the table formatting.
+
+    :param device: DRM device identifier
+    :param clock: Clock type to query
+    :param silent: Turn on to silence error output
+        (you plan to handle manually). Default is on.
+    """
+    freq = clockBuffers()[0]
+    if rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clock], None) != 1:
+        return None
+    ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clock], byref(freq))
+    if rsmi_ret_ok(ret, device, ('get_gpu_clk_freq_', clock), silent):
+        if freq.current >= freq.num_supported:
+            printLog(device, '%s current clock frequency not found' % (clock), None)
+            return None
+        return '{:.0f}Mhz'.format(freq.frequency[freq.current] / 1000000)
+    return None
+
+
 def showCurrentClocks(deviceList, clk_defined=None, concise=False):
     """ Display all clocks for a list of devices
 
@@ -2135,28 +2606,20 @@ def showCurrentClocks(deviceList, clk_defined=None, concise=False):
     :param clk-type: Clock type to display
     """
     global PRINT_JSON
-    freq = rsmi_frequencies_t()
-    bw = rsmi_pcie_bandwidth_t()
+    freq, bw = clockBuffers()
     if not concise:
         printLogSpacer(' Current clock frequencies ')
     for device in deviceList:
         if clk_defined:
             if rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_defined], None) == 1:
                 ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_defined], byref(freq))
-                if rsmi_ret_ok(ret, device, 'get_gpu_clk_freq_' + str(clk_defined), silent=True):
+                if rsmi_ret_ok(ret, device, ('get_gpu_clk_freq_', clk_defined), silent=True):
                     levl = freq.current
                     if levl >= freq.num_supported:
                         printLog(device, '%s current clock frequency not found' % (clk_defined), None)
                         continue
                     fr = freq.frequency[levl] / 1000000
-                    freq_index = levl
-                    if freq.has_deep_sleep:
-                        # sleep state
-                        if levl == 0:
-                            freq_index = 'S'
-                        # all indices are offset by 1 because Deep Sleep occupies index 0
-                        else:
-                            freq_index = levl - 1
+                    freq_index = resolveClockIndex(freq, levl)
                     if concise:  # in case function is used for concise output, no need to print.
                         return '{:.0f}Mhz'.format(fr)
                     printLog(device, '{} clock level'.format(clk_defined), '{} ({:.0f}Mhz)'.format(freq_index, fr))
@@ -2164,28 +2627,23 @@ def showCurrentClocks(deviceList, clk_defined=None, concise=False):
                 logging.debug('{} clock is unsupported on device[{}]'.format(clk_defined, device))
 
         else:  # if clk is not defined, will display all current clk
-            for clk_type in sorted(rsmi_clk_names_dict):
+            for clk_type in SORTED_CLK_NAMES:
                 if rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], None) == 1:
                     ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], byref(freq))
-                    if rsmi_ret_ok(ret, device, 'get_clk_freq_' + str(clk_type), True):
+                    if rsmi_ret_ok(ret, device, ('get_clk_freq_', clk_type), True):
                         levl = freq.current
                         if levl >= freq.num_supported:
                             printLog(device, '%s current clock frequency not found' % (clk_type), None)
                             continue
-                        freq_index = levl
-                        if freq.has_deep_sleep:
-                            # sleep state
-                            if levl == 0:
-                                freq_index = 'S'
-                            # all indices are offset by 1 because Deep Sleep occupies index 0
-                            else:
-                                freq_index = levl - 1
-                        fr = freq.frequency[levl] / 1000000
+                        freq_index = resolveClockIndex(freq, levl)
+                        # Integer MHz; slicing the '.0' off a float rendering
+                        # breaks as soon as the repr isn't two trailing chars
+                        fr_mhz = freq.frequency[levl] // 1000000
                         if PRINT_JSON:
-                            printLog(device, '%s clock speed:' % (clk_type), '(%sMhz)' % (str(fr)[:-2]))
+                            printLog(device, '%s clock speed:' % (clk_type), '(%dMhz)' % (fr_mhz))
                             printLog(device, '%s clock level:' % (clk_type), freq_index)
                         else:
-                            printLog(device, '%s clock level: %s' % (clk_type, freq_index), '(%sMhz)' % (str(fr)[:-2]))
+                            printLog(device, '%s clock level: %s' % (clk_type, freq_index), '(%dMhz)' % (fr_mhz))
                 elif not concise:
                     logging.debug('{} clock is unsupported on device[{}]'.format(clk_type, device))
             # pcie clocks
@@ -2196,7 +2654,7 @@ def showCurrentClocks(deviceList, clk_defined=None, concise=False):
                     if current_f >= bw.transfer_rate.num_supported:
                         printLog(device, 'PCIe current clock frequency not found', None )
                         continue
-                    fr = '{:.1f}GT/s x{}'.format(bw.transfer_rate.frequency[current_f] / 1000000000,
+                    fr = '{:.1f}GT/s x{}'.format(bw.transfer_rate.frequency[current_f] / 1e9,
                                                  bw.lanes[current_f])
                     printLog(device, 'pcie clock level', '{} ({})'.format(current_f, fr))
             elif not concise:
@@ -2212,10 +2670,10 @@ def showCurrentFans(deviceList):
     """
     global PRINT_JSON
     printLogSpacer(' Current Fan Metric ')
-    rpmSpeed = c_int64()
-    sensor_ind = c_uint32(0)
 
-    for device in deviceList:
+    def collectFans(device):
+        rpmSpeed = c_int64()
+        sensor_ind = c_uint32(0)
         (retCode, fanLevel, fanSpeed) = getFanSpeed(device)
         if (retCode == rsmi_status_t.RSMI_STATUS_NOT_SUPPORTED):
             printLog(device, 'Not supported', None)
@@ -2226,7 +2684,7 @@ def showCurrentFans(deviceList):
                 logging.debug('Current fan speed is: %d\n' % (fanSpeed) + \
                             '       Current fan level is: %d\n' % (fanLevel) + \
                             '       (GPU might be cooled with a non-PWM fan)')
-                continue
+                return
             if PRINT_JSON:
                 printLog(device, 'Fan speed (level)', str(fanLevel))
                 printLog(device, 'Fan speed (%)', str(fanSpeed))
@@ -2235,6 +2693,8 @@ def showCurrentFans(deviceList):
             ret = rocmsmi.rsmi_dev_fan_rpms_get(device, sensor_ind, byref(rpmSpeed))
             if rsmi_ret_ok(ret, device, 'get_fan_rpms'):
                 printLog(device, 'Fan RPM', rpmSpeed.value)
+
+    showPerDevice(collectFans, deviceList)
     printLogSpacer()
 
 
@@ -2244,13 +2704,16 @@ def showCurrentTemps(deviceList):
     :param deviceList: List of DRM devices (can be a single-item list)
     """
     printLogSpacer(' Temperature ')
-    for device in deviceList:
+
+    def collectTemps(device):
         for sensor in temp_type_lst:
             temp = getTemp(device, sensor)
             if temp != 'N/A':
                 printLog(device, 'Temperature (Sensor %s) (C)' % (sensor), temp)
             else:
                 printInfoLog(device, 'Temperature (Sensor %s) (C)' % (sensor), temp)
+
+    showPerDevice(collectTemps, deviceList)
     printLogSpacer()
 
 
@@ -2268,30 +2731,32 @@ def showFwInfo(deviceList, fwType):
                 fwType.remove(name)
         firmware_blocks = fwType
     printLogSpacer(' Firmware Information ')
-    for device in deviceList:
+
+    def collectFwInfo(device):
         fw_ver = c_uint64()
         for fw_name in firmware_blocks:
             fw_name = fw_name.upper()
-            ret = rocmsmi.rsmi_dev_firmware_version_get(device, fw_block_names_l.index(fw_name), byref(fw_ver))
-            if rsmi_ret_ok(ret, device, 'get_firmware_version_' + str(fw_name)):
+            ret = rocmsmi.rsmi_dev_firmware_version_get(device, FW_BLOCK_IDX[fw_name], byref(fw_ver))
+            if rsmi_ret_ok(ret, device, ('get_firmware_version_', fw_name)):
                 # The VCN, VCE, UVD, SOS and ASD firmware's value needs to be in hexadecimal
                 if fw_name in ['VCN', 'VCE', 'UVD', 'SOS', 'ASD', 'MES', 'MES KIQ']:
                     printLog(device, '%s firmware version' % (fw_name),
-                             '\t0x%s' % (str(hex(fw_ver.value))[2:].zfill(8)))
+                             '\t0x%08x' % (fw_ver.value))
                 # The TA XGMI, TA RAS, and SMC firmware's hex value looks like 0x12345678
                 # However, they are parsed as: int(0x12).int(0x34).int(0x56).int(0x78)
-                # Which results in the following: 12.34.56.78
+                # Which results in the following: 18.52.86.120
                 elif fw_name in ['TA XGMI', 'TA RAS', 'SMC']:
-                    pos1 = str('%02d' % int((('0x%s' % (str(hex(fw_ver.value))[2:].zfill(8))[0:2])), 16))
-                    pos2 = str('%02d' % int((('0x%s' % (str(hex(fw_ver.value))[2:].zfill(8))[2:4])), 16))
-                    pos3 = str('%02d' % int((('0x%s' % (str(hex(fw_ver.value))[2:].zfill(8))[4:6])), 16))
-                    pos4 = str('%02d' % int((('0x%s' % (str(hex(fw_ver.value))[2:].zfill(8))[6:8])), 16))
-                    printLog(device, '%s firmware version' % (fw_name), '\t%s.%s.%s.%s' % (pos1, pos2, pos3, pos4))
+                    version = fw_ver.value
+                    printLog(device, '%s firmware version' % (fw_name),
+                             '\t%02d.%02d.%02d.%02d' % ((version >> 24) & 0xFF, (version >> 16) & 0xFF,
+                                                        (version >> 8) & 0xFF, version & 0xFF))
                 # The ME, MC, and CE firmware names are only 2 characters, so they need an additional tab
                 elif fw_name in ['ME', 'MC', 'CE']:
                     printLog(device, '%s firmware version' % (fw_name), '\t\t%s' % (str(fw_ver.value)))
                 else:
                     printLog(device, '%s firmware version' % (fw_name), '\t%s' % (str(fw_ver.value)))
+
+    showPerDevice(collectFwInfo, deviceList)
     printLogSpacer()
 
 
@@ -2307,7 +2772,6 @@ def showGpusByPid(pidList):
     # If pidList is empty then we were given 0 arguments, so they want all PIDs
     # dv_indices = (c_uint32 * dv_limit)()
     num_devices = c_uint32()
-    dv_indices = c_void_p()
 
     if not pidList:
         pidList = getPidList()
@@ -2319,13 +2783,13 @@ def showGpusByPid(pidList):
         ret = rocmsmi.rsmi_compute_process_gpus_get(int(pid), None, byref(num_devices))
         if rsmi_ret_ok(ret, metric=('PID ' + pid)):
 
-            dv_indices = (c_uint32 * num_devices.value)()
+            dv_indices = deviceIndexScratch(num_devices.value)
             ret = rocmsmi.rsmi_compute_process_gpus_get(int(pid), dv_indices, byref(num_devices))
 
             if rsmi_ret_ok(ret, metric='get_gpu_compute_process'):
                 metricName = 'PID %s is using %s DRM device(s)' % (pid, str(num_devices.value))
                 if (num_devices.value):
-                    printListLog(metricName, list(dv_indices))
+                    printListLog(metricName, list(dv_indices[:num_devices.value]))
                 else:
                     printLog(None, metricName, None)
         else:
@@ -2378,9 +2842,11 @@ def showGpuUse(deviceList):
     :param deviceList: List of DRM devices (can be a single-item list)
     """
     printLogSpacer(' % time GPU is busy ')
-    for device in deviceList:
-        if getGpuUse(device) != -1:
-            printLog(device, 'GPU use (%)', getGpuUse(device))
+
+    def collectGpuUse(device):
+        use = getGpuUse(device)
+        if use != -1:
+            printLog(device, 'GPU use (%)', use)
         else:
             printLog(device, 'GPU use Unsupported', None)
         util_counters = getCoarseGrainUtil(device, "GFX Activity")
@@ -2390,6 +2856,7 @@ def showGpuUse(deviceList):
         else:
             printInfoLog(device, 'GFX Activity', 'N/A')
 
+    showPerDevice(collectGpuUse, deviceList)
     printLogSpacer()
 
 
@@ -2400,15 +2867,18 @@ def showEnergy(deviceList):
     is 15.3 micro-Joules increment.
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    power = c_uint64()
-    timestamp = c_uint64()
-    counter_resolution = c_float()
     printLogSpacer(" Consumed Energy ")
-    for device in deviceList:
+
+    def collectEnergy(device):
+        power = c_uint64()
+        timestamp = c_uint64()
+        counter_resolution = c_float()
         ret = rocmsmi.rsmi_dev_energy_count_get(device, byref(power), byref(counter_resolution), byref(timestamp))
         if rsmi_ret_ok(ret, device, "% Energy Counter"):
             printLog(device, "Energy counter", power.value)
             printLog(device, "Accumulated Energy (uJ)", round(power.value * counter_resolution.value, 2))
+
+    showPerDevice(collectEnergy, deviceList)
     printLogSpacer()
 
 
@@ -2419,11 +2889,11 @@ def showId(deviceList):
     """
     printLogSpacer(' ID ')
     for device in deviceList:
-        printLog(device, 'Device Name', '\t\t' + str(getDeviceName(device)))
-        printLog(device, 'Device ID', '\t\t' + str(getDRMDeviceId(device)))
-        printLog(device, 'Device Rev', '\t\t' + str(getRev(device)))
-        printLog(device, 'Subsystem ID', '\t' + str(getSubsystemId(device)))
-        printLog(device, 'GUID', '\t\t' + str(getGUID(device)))
+        printLog(device, 'Device Name', '\t\t%s' % (getDeviceName(device)))
+        printLog(device, 'Device ID', '\t\t%s' % (getDRMDeviceId(device)))
+        printLog(device, 'Device Rev', '\t\t%s' % (getRev(device)))
+        printLog(device, 'Subsystem ID', '\t%s' % (getSubsystemId(device)))
+        printLog(device, 'GUID', '\t\t%s' % (getGUID(device)))
     printLogSpacer()
 
 
@@ -2435,8 +2905,9 @@ def showMaxPower(deviceList):
     """
     printLogSpacer(' Power Cap ')
     for device in deviceList:
-        if getMaxPower(device) != -1:
-            printLog(device, 'Max Graphics Package Power (W)', getMaxPower(device))
+        maxPower = getMaxPower(device)
+        if maxPower != -1:
+            printLog(device, 'Max Graphics Package Power (W)', maxPower)
         else:
             printLog(device, 'Max Graphics Package Power Unsupported', None)
     printLogSpacer()
@@ -2473,10 +2944,11 @@ def showMemUse(deviceList):
 
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    memoryUse = c_uint64()
-    avgMemBandwidth = c_uint16()
     printLogSpacer(' Current Memory Use ')
-    for device in deviceList:
+
+    def collectMemUse(device):
+        memoryUse = c_uint64()
+        avgMemBandwidth = c_uint16()
         ret = rocmsmi.rsmi_dev_memory_busy_percent_get(device, byref(memoryUse))
         if rsmi_ret_ok(ret, device, '% memory use'):
             printLog(device, 'GPU memory use (%)', memoryUse.value)
@@ -2492,6 +2964,8 @@ def showMemUse(deviceList):
             printLog(device, 'Avg. Memory Bandwidth', avgMemBandwidth.value)
         else:
             printLog(device, 'Not supported on the given system', None)
+
+    showPerDevice(collectMemUse, deviceList)
     printLogSpacer()
 
 
@@ -2529,13 +3003,13 @@ def showOverDrive(deviceList, odtype):
             odStr = 'GPU'
             ret = rocmsmi.rsmi_dev_overdrive_level_get(device, byref(rsmi_od))
             od = rsmi_od.value
-            if not rsmi_ret_ok(ret, device, 'get_overdrive_level_' + str(odtype)):
+            if not rsmi_ret_ok(ret, device, ('get_overdrive_level_', odtype)):
                 continue
         elif odtype == 'mclk':
             odStr = 'GPU Memory'
             ret = rocmsmi.rsmi_dev_mem_overdrive_level_get(device, byref(rsmi_od))
             od = rsmi_od.value
-            if not rsmi_ret_ok(ret, device, 'get_mem_overdrive_level_' + str(odtype)):
+            if not rsmi_ret_ok(ret, device, ('get_mem_overdrive_level_', odtype)):
                 continue
         else:
             printErrLog(device, 'Unable to retrieve OverDrive')
@@ -2549,11 +3023,12 @@ def showPcieBw(deviceList):
 
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    sent = c_uint64()
-    received = c_uint64()
-    max_pkt_sz = c_uint64()
     printLogSpacer(' Measured PCIe Bandwidth ')
-    for device in deviceList:
+
+    def collectPcieBw(device):
+        sent = c_uint64()
+        received = c_uint64()
+        max_pkt_sz = c_uint64()
         ret = rocmsmi.rsmi_dev_pci_throughput_get(device, byref(sent), byref(received), byref(max_pkt_sz))
         if rsmi_ret_ok(ret, device, 'get_PCIe_bandwidth'):
             # Use 1024.0 to ensure that the result is a float and not integer division
@@ -2563,6 +3038,8 @@ def showPcieBw(deviceList):
             printLog(device, 'Estimated maximum PCIe bandwidth over the last second (MB/s)', bwstr)
         else:
             logging.debug('GPU PCIe bandwidth usage not supported')
+
+    showPerDevice(collectPcieBw, deviceList)
     printLogSpacer()
 
 
@@ -2571,12 +3048,15 @@ def showPcieReplayCount(deviceList):
 
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    counter = c_uint64()
     printLogSpacer(' PCIe Replay Counter ')
-    for device in deviceList:
+
+    def collectReplayCount(device):
+        counter = c_uint64()
         ret = rocmsmi.rsmi_dev_pci_replay_counter_get(device, byref(counter))
         if rsmi_ret_ok(ret, device, 'PCIe Replay Count'):
             printLog(device, 'PCIe Replay Count', counter.value)
+
+    showPerDevice(collectReplayCount, deviceList)
     printLogSpacer()
 
 
@@ -2587,13 +3067,26 @@ def showPerformanceLevel(deviceList):
     """
     printLogSpacer(' Show Performance Level ')
     for device in deviceList:
-        if getPerfLevel(device) != -1:
-            printLog(device, 'Performance Level', str(getPerfLevel(device)).lower())
+        perfLevel = getPerfLevel(device)
+        if perfLevel != -1:
+            printLog(device, 'Performance Level', str(perfLevel).lower())
         else:
             printLog(device, 'Performance Level Unsupported', None)
     printLogSpacer()
 
 
+# Scratch array for process GPU-index queries, grown as needed and reused
+# across PIDs instead of constructing a ctypes array per process
+_DV_INDICES_SCRATCH = (c_uint32 * 0)()
+
+def deviceIndexScratch(count):
+    """ Return a c_uint32 scratch array with room for count entries """
+    global _DV_INDICES_SCRATCH
+    if count > len(_DV_INDICES_SCRATCH):
+        _DV_INDICES_SCRATCH = (c_uint32 * count)()
+    return _DV_INDICES_SCRATCH
+
+
 def showPids(verbose):
     """ Show Information for PIDs created in a KFD (Compute) context """
     printLogSpacer(' KFD Processes ')
@@ -2608,7 +3101,6 @@ def showPids(verbose):
         printLog(None, 'No KFD PIDs currently running', None)
         printLogSpacer()
         return
-    dv_indices = c_void_p()
     num_devices = c_uint32()
     proc = rsmi_process_info_t()
     for pid in pidList:
@@ -2617,17 +3109,18 @@ def showPids(verbose):
         sdmaUsage = 'UNKNOWN'
         cuOccupancy = 'UNKNOWN'
         cuOccupancyInvalid = 0xFFFFFFFF
-        dv_indices = (c_uint32 * num_devices.value)()
+        deviceIndices = ()
         ret = rocmsmi.rsmi_compute_process_gpus_get(int(pid), None, byref(num_devices))
         if rsmi_ret_ok(ret, metric='get_gpu_compute_process'):
-            dv_indices = (c_uint32 * num_devices.value)()
+            dv_indices = deviceIndexScratch(num_devices.value)
             ret = rocmsmi.rsmi_compute_process_gpus_get(int(pid), dv_indices, byref(num_devices))
             if rsmi_ret_ok(ret, metric='get_gpu_compute_process'):
                 gpuNumber = str(num_devices.value)
+                deviceIndices = dv_indices[:num_devices.value]
             else:
                 logging.debug('Unable to fetch GPU number by PID')
         if verbose == "details":
-            for dv_ind in dv_indices:
+            for dv_ind in deviceIndices:
                 ret = rocmsmi.rsmi_compute_process_info_by_device_get(int(pid), dv_ind, byref(proc))
                 if rsmi_ret_ok(ret, metric='get_compute_process_info_by_pid'):
                     vramUsage = proc.vram_usage
@@ -2658,9 +3151,9 @@ def showPower(deviceList):
 
     :param deviceList: List of DRM devices (can be a single-item list)
     """
-    secondaryPresent=False
     printLogSpacer(' Power Consumption ')
-    for device in deviceList:
+
+    def collectPower(device):
         power_dict = getPower(device)
         power = 'N/A'
         if (power_dict['ret'] == rsmi_status_t.RSMI_STATUS_SUCCESS and 
@@ -2671,10 +3164,13 @@ def showPower(deviceList):
                     power)
         elif checkIfSecondaryDie(device):
             printLog(device, 'Average Graphics Package Power (W)', "N/A (Secondary die)")
-            secondaryPresent=True
+            return True
         else:
             printErrLog(device, 'Unable to get Average or Current Socket Graphics Package Power Consumption')
-    if secondaryPresent:
+        return False
+
+    secondaryDies = showPerDevice(collectPower, deviceList)
+    if any(secondaryDies.values()):
         printLog(None, "\n\t\tPrimary die (usually one above or below the secondary) shows total (primary + secondary) socket power information", None)
     printLogSpacer()
 
@@ -2735,19 +3231,20 @@ def showProduct(deviceList):
             # Device SKU is just the characters in between the two '-' in vbios_version
             vbios = getVbiosVersion(device, True)
             device_sku = "N/A"
-            if vbios.count('-') == 2 and len(str(vbios.split('-')[1])) > 1:
-                device_sku = vbios.split('-')[1]
+            vbiosParts = vbios.split('-')
+            if len(vbiosParts) == 3 and len(vbiosParts[1]) > 1:
+                device_sku = vbiosParts[1]
 
-            printLog(device, 'Card Series', '\t\t' + str(getDeviceName(device)))
+            printLog(device, 'Card Series', '\t\t%s' % (getDeviceName(device)))
             # Retrieve device ID from DRM and KFD
-            printLog(device, 'Card Model', str('\t\t' + getDRMDeviceId(device)))
-            printLog(device, 'Card Vendor', '\t\t' + getVendor(device))
-            printLog(device, 'Card SKU', '\t\t' + device_sku)
-            printLog(device, 'Subsystem ID', str('\t' + getSubsystemId(device)))
-            printLog(device, 'Device Rev', str('\t\t' + getRev(device)))
-            printLog(device, 'Node ID', str('\t\t' + str(getNodeId(device))))
-            printLog(device, 'GUID', str('\t\t' + str(getGUID(device))))
-            printLog(device, 'GFX Version', str('\t\t' + getTargetGfxVersion(device)))
+            printLog(device, 'Card Model', '\t\t%s' % (getDRMDeviceId(device)))
+            printLog(device, 'Card Vendor', '\t\t%s' % (getVendor(device)))
+            printLog(device, 'Card SKU', '\t\t%s' % (device_sku))
+            printLog(device, 'Subsystem ID', '\t%s' % (getSubsystemId(device)))
+            printLog(device, 'Device Rev', '\t\t%s' % (getRev(device)))
+            printLog(device, 'Node ID', '\t\t%s' % (getNodeId(device)))
+            printLog(device, 'GUID', '\t\t%s' % (getGUID(device)))
+            printLog(device, 'GFX Version', '\t\t%s' % (getTargetGfxVersion(device)))
 
         else:
             vendor = getVendor(device)
@@ -2770,19 +3267,14 @@ def showProfile(deviceList):
     for device in deviceList:
         ret = rocmsmi.rsmi_dev_power_profile_presets_get(device, 0, byref(status))
         if rsmi_ret_ok(ret, device, 'get_power_profiles', silent=False):
-            binaryMaskString = str(format(status.available_profiles, '07b'))[::-1]
-            bitMaskPosition = 0
             profileNumber = 0
-            while (bitMaskPosition < 7):
-                if binaryMaskString[bitMaskPosition] == '1':
-                    profileNumber = profileNumber + 1
-                    if 2 ** bitMaskPosition == status.current:
-                        printLog(device, '%d. Available power profile (#%d of 7)' % \
-                                 (profileNumber, bitMaskPosition + 1), profileString(2 ** bitMaskPosition) + '*')
-                    else:
-                        printLog(device, '%d. Available power profile (#%d of 7)' % \
-                                 (profileNumber, bitMaskPosition + 1), profileString(2 ** bitMaskPosition))
-                bitMaskPosition = bitMaskPosition + 1
+            for bit in range(7):
+                profileMask = 1 << bit
+                if status.available_profiles & profileMask:
+                    profileNumber += 1
+                    marker = '*' if profileMask == status.current else ''
+                    printLog(device, '%d. Available power profile (#%d of 7)' % \
+                             (profileNumber, bit + 1), profileString(profileMask) + marker)
     printLogSpacer()
 
 
@@ -2832,6 +3324,10 @@ def showRasInfo(deviceList, rasType):
     :param deviceList: List of DRM devices (can be a single-item list)
     :param rasType: [$validRasBlocks] RAS counter to display (all if left empty)
     """
+    # The RAS table is text-only; skip the per-block ECC queries entirely
+    # when the output mode would drop the table anyway
+    if suppressTextOutput():
+        return
     state = rsmi_ras_err_state_t()
     if not rasType or 'all' in rasType:
         rasBlocks = rsmi_gpu_block_d.keys()
@@ -2849,7 +3345,7 @@ def showRasInfo(deviceList, rasType):
         for block in rasBlocks:
             row = []
             ret = rocmsmi.rsmi_dev_ecc_status_get(device, rsmi_gpu_block_d[block], byref(state))
-            if rsmi_ret_ok(ret, device, 'get_ecc_status_' + str(block), True):
+            if rsmi_ret_ok(ret, device, ('get_ecc_status_', block), True):
                 row.append(block)
                 row.append(rsmi_ras_err_stale_machine[state.value].upper())
                 # Now add the error count
@@ -2873,6 +3369,8 @@ def showRetiredPages(deviceList, retiredType='all'):
     :param deviceList: List of DRM devices (can be a single-item list)
     :param retiredType: Type of retired pages to show (default = all)
     """
+    if suppressTextOutput():
+        return
     printLogSpacer(' Pages Info ')
     num_pages = c_uint32()
     records = rsmi_retired_page_record_t()
@@ -3564,6 +4062,8 @@ def initializeRsmi():
     global rocmsmi
     # Initialize rsmiBindings
     rocmsmi = initRsmiBindings(silent=PRINT_JSON)
+    # Declare prototypes once so calls skip per-argument type inference
+    declareFunctionPrototypes(rocmsmi)
     # Check if amdgpu is initialized before initializing rsmi
     if driverInitialized() is True:
         ret_init = rocmsmi.rsmi_init(0)
@@ -3575,6 +4075,7 @@ def initializeRsmi():
         exit(0)
 
 
+@memoizeStaticGetter
 def isAmdDevice(device):
     """ Return whether the specified device is an AMD device or not
 
@@ -3675,6 +4176,9 @@ def relaunchAsSudo():
         #os.execvp('sudo', ['sudo', '-E'] + sys.argv)
 
 
+_RSMI_STATUS_SUCCESS = rsmi_status_t.RSMI_STATUS_SUCCESS
+_ERR_STRING_CACHE = {}
+
 def rsmi_ret_ok(my_ret, device=None, metric=None, silent=False):
     """ Returns true if RSMI call status is 0 (success)
 
@@ -3682,36 +4186,48 @@ def rsmi_ret_ok(my_ret, device=None, metric=None, silent=False):
 
     :param device: DRM device identifier
     :param my_ret: Return of RSMI call (rocm_smi_lib API)
-    :param metric: Parameter of GPU currently being analyzed
+    :param metric: Parameter of GPU currently being analyzed;
+        a tuple of parts is joined only when the call failed
     :param silent: Echo verbose error reponse.
         True silences err output, False does not silence err output (default).
     """
     global RETCODE
     global PRINT_JSON
-    if my_ret != rsmi_status_t.RSMI_STATUS_SUCCESS:
+    # Success is the overwhelmingly common case; return before touching
+    # any of the error-string machinery
+    if my_ret == _RSMI_STATUS_SUCCESS:
+        return True
+    # The library's status strings are fixed per code; translate each one
+    # through the FFI once (watch-style loops re-fail with the same code)
+    err_string = _ERR_STRING_CACHE.get(my_ret)
+    if err_string is None:
         err_str = c_char_p()
         rocmsmi.rsmi_status_string(my_ret, byref(err_str))
-        # leaving the commented out prints/logs to help identify errors in the future
-        # print("error string = " + str(err_str))
-        # print("error string (w/ decode)= " + str(err_str.value.decode()))
-        returnString = ''
-        if device is not None:
-            returnString += '%s GPU[%s]:' % (my_ret, device)
-        if metric is not None:
-            returnString += ' %s: ' % (metric)
-        else:
-            metric = ''
-        if err_str.value is not None:
-            returnString += '%s\t' % (err_str.value.decode())
-        if not PRINT_JSON:
-            # logging.debug('%s', returnString)
-            if not silent:
-                logging.debug('%s', returnString)
-                if my_ret in rsmi_status_verbose_err_out:
-                    printLog(device, metric + ", " + rsmi_status_verbose_err_out[my_ret], None)
-        RETCODE = my_ret
-        return False
-    return True
+        err_string = _ERR_STRING_CACHE[my_ret] = err_str.value
+    # Hot call sites pass the metric as parts; only assemble the string
+    # here on the failure path, since success is the common case
+    if isinstance(metric, tuple):
+        metric = ''.join(map(str, metric))
+    # leaving the commented out prints/logs to help identify errors in the future
+    # print("error string = " + str(err_string))
+    # print("error string (w/ decode)= " + str(err_string.decode()))
+    returnString = ''
+    if device is not None:
+        returnString += '%s GPU[%s]:' % (my_ret, device)
+    if metric is not None:
+        returnString += ' %s: ' % (metric)
+    else:
+        metric = ''
+    if err_string is not None:
+        returnString += '%s\t' % (err_string.decode())
+    if not PRINT_JSON:
+        # logging.debug('%s', returnString)
+        if not silent:
+            logging.debug('%s', returnString)
+            if my_ret in rsmi_status_verbose_err_out:
+                printLog(device, metric + ", " + rsmi_status_verbose_err_out[my_ret], None)
+    RETCODE = my_ret
+    return False
 
 def save(deviceList, savefilepath):
     """ Save clock frequencies and fan speeds for a list of devices to a specified file path.
@@ -3732,15 +4248,16 @@ def save(deviceList, savefilepath):
         printLogSpacer()
         sys.exit()
     for device in deviceList:
-        if getPerfLevel(device) != -1:
-            perfLevels[device] = str(getPerfLevel(device)).lower()
+        perfLevel = getPerfLevel(device)
+        if perfLevel != -1:
+            perfLevels[device] = str(perfLevel).lower()
         else:
             perfLevels[device] = 'Unsupported'
         freq = rsmi_frequencies_t()
         for clk_type in sorted(rsmi_clk_names_dict):
             clocks[device] = clocks.get(device, {})
             ret = rocmsmi.rsmi_dev_gpu_clk_freq_get(device, rsmi_clk_names_dict[clk_type], byref(freq))
-            if rsmi_ret_ok(ret, device, 'get_gpu_clk_freq_' + str(clk_type), True):
+            if rsmi_ret_ok(ret, device, ('get_gpu_clk_freq_', clk_type), True):
                 clocks[device][clk_type] = str(freq.current)
             else:
                 clocks[device][clk_type] = '0'
@@ -3777,6 +4294,21 @@ def isConciseInfoRequested(args):
     return is_concise_req
 
 if __name__ == '__main__':
+    # Die quietly on EPIPE (e.g. piped into head) instead of unwinding
+    # through BrokenPipeError handlers on every subsequent write
+    if hasattr(signal, 'SIGPIPE'):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    # Redirected output is block-buffered by Python already; widen the
+    # buffer so a full report flushes in a few large writes instead of
+    # every 8 KiB. TTYs are left line-buffered so progress output stays
+    # live, and the interpreter flushes sys.stdout on exit as usual.
+    if not sys.stdout.isatty():
+        try:
+            sys.stdout = io.TextIOWrapper(
+                open(sys.stdout.fileno(), 'wb', buffering=1 << 16, closefd=False),
+                encoding=sys.stdout.encoding, write_through=False)
+        except (AttributeError, OSError, ValueError):
+            pass
     parser = argparse.ArgumentParser(
         description='AMD ROCm System Management Interface  |  ROCM-SMI version: %s' % __version__,
         formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=90, width=120))
@@ -3933,6 +4465,12 @@ if __name__ == '__main__':
                                help='Response to automatically provide for all prompts (NOT RECOMMENDED)',
                                metavar='RESPONSE')
 
+    groupServer = parser.add_argument_group('Resident server options')
+    groupServer.add_argument('--serve', help='Stay resident and answer snapshot queries on a UNIX socket',
+                             metavar='SOCKET')
+    groupServer.add_argument('--connect', help='Query a resident server instead of initializing the library',
+                             metavar='SOCKET')
+
     groupActionOutput.add_argument('--loglevel',
                                    help='How much output will be printed for what program is doing, one of debug/info/warning/error/critical',
                                    metavar='LEVEL')
@@ -3944,6 +4482,11 @@ if __name__ == '__main__':
     # Must set PRINT_JSON early so the prints can be silenced
     if args.json or args.csv:
         PRINT_JSON = True
+    bindPrinters()
+
+    # Served from a warm process; skip library initialization entirely
+    if args.connect:
+        sys.exit(queryServer(args.connect, args.device))
 
     # Initialize the rocm SMI library
     initializeRsmi()
@@ -3986,10 +4529,14 @@ if __name__ == '__main__':
         printLog(None, 'ERROR: No DRM devices available. Exiting', None)
         sys.exit(1)
 
-    # If we want JSON/CSV output, initialize the keys (devices)
+    if args.serve:
+        runServer(args.serve, deviceList)
+        sys.exit()
+
+    # If we want JSON/CSV output, initialize the keys (devices) up front so
+    # the formatters never have to lazily create (or re-derive) them
     if PRINT_JSON:
-        for device in deviceList:
-            JSON_DATA['card' + str(device)] = {}
+        JSON_DATA.update(('card%d' % (device), {}) for device in deviceList)
 
     if not PRINT_JSON:
         print('\n')
@@ -4234,8 +4781,9 @@ if __name__ == '__main__':
         # Check that we have some actual data to print, instead of the
         # empty list that we initialized above
         for device in deviceList:
-            if not JSON_DATA['card' + str(device)]:
-                JSON_DATA.pop('card' + str(device))
+            cardKey = 'card%d' % (device)
+            if not JSON_DATA[cardKey]:
+                JSON_DATA.pop(cardKey)
         if not JSON_DATA:
             logging.warn("No JSON data to report")
             sys.exit(RETCODE)
@@ -4260,5 +4808,6 @@ if __name__ == '__main__':
     if not isConciseInfoRequested(args) and args.showhw == False:
         printLogSpacer(footerString)
 
+    flushLog()
     rsmi_ret_ok(rocmsmi.rsmi_shut_down())
     exit(RETCODE)
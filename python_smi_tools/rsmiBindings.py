@@ -639,4 +639,107 @@ rsmi_power_type_dict = {
     0: 'AVERAGE',
     1: 'CURRENT SOCKET',
     0xFFFFFFFF: 'INVALID_POWER_TYPE'
-}
\ No newline at end of file
+}
+
+# Prototypes for the fixed-signature library entry points used by the CLI.
+# Without declared argtypes ctypes re-derives the conversion for every
+# argument on every call; declaring them once moves that work to startup.
+# Types mirror how the CLI calls each symbol. Entry points whose pointer
+# arguments vary between call sites (e.g. rsmi_topo_get_link_type) or take
+# caller-sized buffers are left undeclared on purpose.
+_RSMI_FUNCTION_PROTOTYPES = {
+    'rsmi_init': [c_uint64],
+    'rsmi_shut_down': [],
+    'rsmi_num_monitor_devices': [POINTER(c_uint32)],
+    'rsmi_status_string': [c_int, POINTER(c_char_p)],
+    'rsmi_version_get': [POINTER(rsmi_version_t)],
+    'rsmi_compute_process_info_get': [POINTER(rsmi_process_info_t), POINTER(c_uint32)],
+    'rsmi_version_str_get': [c_int, c_char_p, c_uint32],
+    'rsmi_dev_vendor_id_get': [c_uint32, POINTER(c_uint16)],
+    'rsmi_dev_id_get': [c_uint32, POINTER(c_short)],
+    'rsmi_dev_revision_get': [c_uint32, POINTER(c_short)],
+    'rsmi_dev_vendor_name_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_name_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_subsystem_name_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_vbios_version_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_serial_number_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_vram_vendor_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_compute_partition_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_memory_partition_get': [c_uint32, c_char_p, c_uint32],
+    'rsmi_dev_guid_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_node_id_get': [c_uint32, POINTER(c_uint32)],
+    'rsmi_dev_target_graphics_version_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_unique_id_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_pci_id_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_pci_throughput_get': [c_uint32, POINTER(c_uint64),
+                                    POINTER(c_uint64), POINTER(c_uint64)],
+    'rsmi_dev_pci_replay_counter_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_busy_percent_get': [c_uint32, POINTER(c_uint32)],
+    'rsmi_dev_memory_busy_percent_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_memory_usage_get': [c_uint32, c_int, POINTER(c_uint64)],
+    'rsmi_dev_memory_total_get': [c_uint32, c_int, POINTER(c_uint64)],
+    'rsmi_dev_fan_speed_get': [c_uint32, c_uint32, POINTER(c_int64)],
+    'rsmi_dev_fan_speed_max_get': [c_uint32, c_uint32, POINTER(c_int64)],
+    'rsmi_dev_fan_rpms_get': [c_uint32, c_uint32, POINTER(c_int64)],
+    'rsmi_dev_fan_reset': [c_uint32, c_uint32],
+    'rsmi_dev_fan_speed_set': [c_uint32, c_uint32, c_uint64],
+    'rsmi_dev_temp_metric_get': [c_uint32, c_uint32, c_int, POINTER(c_int64)],
+    'rsmi_dev_volt_metric_get': [c_uint32, rsmi_voltage_type_t,
+                                 rsmi_voltage_metric_t, POINTER(c_uint64)],
+    'rsmi_dev_perf_level_get': [c_uint32, POINTER(rsmi_dev_perf_level_t)],
+    'rsmi_dev_perf_level_set': [c_uint32, rsmi_dev_perf_level_t],
+    'rsmi_dev_overdrive_level_get': [c_uint32, POINTER(c_uint32)],
+    'rsmi_dev_mem_overdrive_level_get': [c_uint32, POINTER(c_uint32)],
+    'rsmi_dev_overdrive_level_set': [c_uint32, rsmi_dev_perf_level_t],
+    'rsmi_dev_gpu_clk_freq_get': [c_uint32, c_int, POINTER(rsmi_frequencies_t)],
+    'rsmi_dev_gpu_clk_freq_set': [c_uint32, c_int, c_uint64],
+    'rsmi_dev_pci_bandwidth_get': [c_uint32, POINTER(rsmi_pcie_bandwidth_t)],
+    'rsmi_dev_pci_bandwidth_set': [c_uint32, c_uint64],
+    'rsmi_dev_power_cap_get': [c_uint32, c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_power_cap_default_get': [c_uint32, POINTER(c_uint64)],
+    'rsmi_dev_power_cap_range_get': [c_uint32, c_uint32, POINTER(c_uint64),
+                                     POINTER(c_uint64)],
+    'rsmi_dev_power_cap_set': [c_uint32, c_uint32, c_uint64],
+    'rsmi_dev_power_get': [c_uint32, POINTER(c_int64),
+                           POINTER(rsmi_power_type_t)],
+    'rsmi_dev_energy_count_get': [c_uint32, POINTER(c_uint64),
+                                  POINTER(c_float), POINTER(c_uint64)],
+    'rsmi_dev_ecc_status_get': [c_uint32, c_uint64,
+                                POINTER(rsmi_ras_err_state_t)],
+    'rsmi_dev_ecc_count_get': [c_uint32, c_uint64,
+                               POINTER(rsmi_error_count_t)],
+    'rsmi_dev_firmware_version_get': [c_uint32, c_int, POINTER(c_uint64)],
+    'rsmi_dev_xgmi_error_status': [c_uint32, POINTER(rsmi_xgmi_status_t)],
+    'rsmi_dev_xgmi_error_reset': [c_uint32],
+    'rsmi_dev_od_volt_info_get': [c_uint32, POINTER(rsmi_od_volt_freq_data_t)],
+    'rsmi_dev_activity_avg_mm_get': [c_uint32, POINTER(c_uint16)],
+    'rsmi_utilization_count_get': [c_uint32, POINTER(rsmi_utilization_counter_t),
+                                   c_uint32, POINTER(c_uint64)],
+    'rsmi_topo_get_numa_node_number': [c_uint32, POINTER(c_int32)],
+    'rsmi_topo_numa_affinity_get': [c_uint32, POINTER(c_int32)],
+    'rsmi_topo_get_link_weight': [c_uint32, c_uint32, POINTER(c_uint64)],
+    'rsmi_minmax_bandwidth_get': [c_uint32, c_uint32, POINTER(c_uint32),
+                                  POINTER(c_uint32)],
+    'rsmi_is_P2P_accessible': [c_uint32, c_uint32, POINTER(c_bool)],
+    'rsmi_event_notification_init': [c_uint32],
+    'rsmi_event_notification_mask_set': [c_uint32, c_uint64],
+    'rsmi_event_notification_stop': [c_uint32],
+}
+
+
+def declareFunctionPrototypes(rocmsmiLib):
+    """ Declare argtypes/restype on the library's fixed-signature entry points
+
+        Symbols missing from older library builds are skipped; calls to them
+        keep the generic (slower) ctypes conversion path, same as before.
+
+    :param rocmsmiLib: Library handle returned by initRsmiBindings()
+    """
+    for name, argtypes in _RSMI_FUNCTION_PROTOTYPES.items():
+        try:
+            fn = getattr(rocmsmiLib, name)
+        except AttributeError:
+            continue
+        fn.argtypes = argtypes
+        fn.restype = c_int
+    return rocmsmiLib
\ No newline at end of file